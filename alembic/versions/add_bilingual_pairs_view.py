@@ -0,0 +1,47 @@
+"""Add bilingual_pairs materialized view
+
+Revision ID: add_bilingual_pairs_view
+Revises: add_language_tsvectors
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_bilingual_pairs_view'
+down_revision = 'add_language_tsvectors'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create bilingual_pairs view (one EN/RU quote pair per group)."""
+    # Materialized views are PostgreSQL-only (SQLite joins at query time)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS bilingual_pairs AS
+        SELECT en.bilingual_group_id AS group_id,
+               min(en.id) AS en_id,
+               min(ru.id) AS ru_id
+        FROM quotes en
+        JOIN quotes ru ON ru.bilingual_group_id = en.bilingual_group_id
+        WHERE en.language = 'en' AND ru.language = 'ru'
+        GROUP BY en.bilingual_group_id
+    """)
+
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_bilingual_pairs_group "
+        "ON bilingual_pairs(group_id)"
+    )
+
+
+def downgrade():
+    """Drop bilingual_pairs view."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS bilingual_pairs")
@@ -0,0 +1,51 @@
+"""Add per-language generated tsvector columns to quotes table
+
+Revision ID: add_language_tsvectors
+Revises: add_bilingual_group
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_language_tsvectors'
+down_revision = 'add_bilingual_group'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add text_tsv_en/text_tsv_ru generated columns with GIN indexes."""
+    # Generated columns and GIN are PostgreSQL-only (SQLite uses LIKE search)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        "ALTER TABLE quotes ADD COLUMN IF NOT EXISTS text_tsv_en tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', text)) STORED"
+    )
+    op.execute(
+        "ALTER TABLE quotes ADD COLUMN IF NOT EXISTS text_tsv_ru tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('russian', text)) STORED"
+    )
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quotes_tsv_en "
+        "ON quotes USING GIN (text_tsv_en)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quotes_tsv_ru "
+        "ON quotes USING GIN (text_tsv_ru)"
+    )
+
+
+def downgrade():
+    """Remove per-language tsvector columns."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP INDEX IF EXISTS idx_quotes_tsv_ru")
+    op.execute("DROP INDEX IF EXISTS idx_quotes_tsv_en")
+    op.execute("ALTER TABLE quotes DROP COLUMN IF EXISTS text_tsv_ru")
+    op.execute("ALTER TABLE quotes DROP COLUMN IF EXISTS text_tsv_en")
@@ -0,0 +1,36 @@
+"""Replace quotes language index with a (language, id) index
+
+Revision ID: add_language_id_index
+Revises: add_bilingual_pairs_view
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_language_id_index'
+down_revision = 'add_bilingual_pairs_view'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index (language, id) so per-language scans come back in id order."""
+    # create_all already builds this index on databases made from models
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quotes_language_id "
+        "ON quotes (language, id)"
+    )
+
+    # The composite index covers language-only lookups as well; databases
+    # built by init_database.py may never have had the old index
+    op.execute("DROP INDEX IF EXISTS idx_quotes_language")
+
+
+def downgrade():
+    """Restore the single-column language index."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quotes_language ON quotes (language)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_quotes_language_id")
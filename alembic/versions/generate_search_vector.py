@@ -0,0 +1,68 @@
+"""Replace the search_vector trigger with a generated column
+
+Revision ID: generate_search_vector
+Revises: add_language_id_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'generate_search_vector'
+down_revision = 'add_language_id_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Compute search_vector as a STORED column instead of in a trigger."""
+    # tsvector, triggers and generated columns are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS tsvector_update_quote ON quotes")
+    op.execute("DROP FUNCTION IF EXISTS update_quote_search_vector()")
+
+    # A plain column cannot be made generated in place; dropping it also
+    # drops its GIN index, and the new column is filled on creation
+    op.execute("ALTER TABLE quotes DROP COLUMN IF EXISTS search_vector")
+    op.execute(
+        "ALTER TABLE quotes ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', text)) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quotes_search_vector "
+        "ON quotes USING GIN (search_vector)"
+    )
+
+
+def downgrade():
+    """Restore the trigger-maintained search_vector column."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE quotes DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE quotes ADD COLUMN search_vector tsvector")
+    op.execute(
+        "UPDATE quotes SET search_vector = to_tsvector('simple', text)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quotes_search_vector "
+        "ON quotes USING GIN (search_vector)"
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_quote_search_vector()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector('simple', NEW.text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tsvector_update_quote
+        BEFORE INSERT OR UPDATE ON quotes
+        FOR EACH ROW
+        EXECUTE FUNCTION update_quote_search_vector()
+    """)
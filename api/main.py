@@ -5,22 +5,80 @@ Main application module that sets up the FastAPI server,
 configures CORS, and includes all API routes.
 """
 
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from api.routes import quotes, authors, sources
 from config import settings
+from database import SessionLocal
+from repositories.quote_repository import QuoteRepository
+from services.search_service import SearchService
 from utils.error_handling import AphoriumError, format_error_response
+from utils.cache import init_cache, close_cache
 from logger_config import logger
 
+# Try to import Brotli middleware (optional, better ratio on Cyrillic text)
+try:
+    from brotli_asgi import BrotliMiddleware
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+    BrotliMiddleware = None
+
+
+def warm_up_queries() -> None:
+    """
+    Run each hot query once so its compiled SQL is cached.
+
+    SQLAlchemy caches compiled statements per engine; without this the
+    first requests after every worker start pay for compilation and for
+    opening the first pooled connection.
+    """
+    db = SessionLocal()
+    try:
+        quote_repo = QuoteRepository(db)
+        search_service = SearchService(db)
+        search_service.search(query="test", limit=1)
+        search_service.get_bilingual_pairs(limit=1)
+        quote = quote_repo.get_random(bilingual_only=True)
+        quote_repo.get_random()
+        quote_repo.get_with_translations(quote.id if quote else 0)
+        logger.info("Warmed up query cache")
+    except Exception as e:
+        # An empty or not yet initialized database must not block startup
+        logger.warning(f"Query warm-up failed: {e}")
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up and tear down shared resources."""
+    # Route handlers use the sync SQLAlchemy session and run in anyio's
+    # worker threads; the default limit of 40 caps request concurrency
+    to_thread.current_default_thread_limiter().total_tokens = (
+        settings.api_thread_limit
+    )
+    init_cache(settings.redis_url, settings.redis_max_connections)
+    await to_thread.run_sync(warm_up_queries)
+    yield
+    close_cache()
+
+
 # Create FastAPI app with metadata
 app = FastAPI(
     title="Aphorium API",
     description="Search engine for aphorisms and quotes from English and Russian literature",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware (for frontend access)
@@ -33,6 +91,13 @@ if settings.enable_cors:
         allow_headers=["*"],
     )
 
+# Response compression (large search pages are mostly prose)
+# Brotli middleware falls back to gzip for clients without br support
+if HAS_BROTLI:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Exception handlers
 @app.exception_handler(AphoriumError)
 async def aphorium_error_handler(request: Request, exc: AphoriumError):
@@ -42,6 +107,22 @@ async def aphorium_error_handler(request: Request, exc: AphoriumError):
         content=format_error_response(exc)
     )
 
+
+@app.exception_handler(Exception)
+async def unhandled_error_handler(request: Request, exc: Exception):
+    """Log unexpected errors once and return a generic 500 response."""
+    # Log the type only: str() of some errors (e.g. response validation
+    # holding detached ORM objects) can itself raise
+    logger.error(
+        f"Unhandled {type(exc).__name__} on "
+        f"{request.method} {request.url.path}",
+        exc_info=exc
+    )
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content=format_error_response(exc)
+    )
+
 # Include routers
 app.include_router(quotes.router, prefix="/api/quotes", tags=["quotes"])
 app.include_router(authors.router, prefix="/api/authors", tags=["authors"])
@@ -65,12 +146,18 @@ def health() -> dict:
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     logger.info("Starting Aphorium API server")
     uvicorn.run(
         "api.main:app",
         host=settings.api_host,
         port=settings.api_port,
+        # Request the C implementations explicitly so a missing extension
+        # fails loudly instead of silently falling back to asyncio/h11
+        # (uvloop is not available on Windows)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         reload=True
     )
 
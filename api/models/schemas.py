@@ -3,7 +3,7 @@ Pydantic schemas for API request/response models.
 """
 
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AuthorSchema(BaseModel):
@@ -15,10 +15,7 @@ class AuthorSchema(BaseModel):
     name_ru: Optional[str] = None  # Russian name version
     bio: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SourceSchema(BaseModel):
@@ -29,10 +26,7 @@ class SourceSchema(BaseModel):
     language: str
     source_type: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuoteSchema(BaseModel):
@@ -47,10 +41,7 @@ class QuoteSchema(BaseModel):
     translation_count: Optional[int] = None
     created_at: Optional[str] = None  # ISO format timestamp
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuoteWithTranslationsSchema(BaseModel):
@@ -63,10 +54,7 @@ class QuoteWithTranslationsSchema(BaseModel):
     source: Optional[SourceSchema] = None
     translations: list[QuoteSchema] = []
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BilingualPairSchema(BaseModel):
@@ -77,3 +65,9 @@ class BilingualPairSchema(BaseModel):
     is_translated: bool = False  # True if translation was generated, False if from DB
     translation_source: Optional[str] = None  # e.g., "word_translation_dict" if translated
 
+
+class BilingualPairPageSchema(BaseModel):
+    """Keyset-paginated page of bilingual quote pairs."""
+
+    items: list[BilingualPairSchema] = []
+    next_cursor: Optional[int] = None  # Pass as 'after' to get the next page
@@ -3,25 +3,53 @@ Author API routes.
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from database import get_db
 from repositories.author_repository import AuthorRepository
 from api.models.schemas import AuthorSchema
-from logger_config import logger
+from models import Author
+from utils.cache import cached, etag_response
 
 router = APIRouter()
 
 
+def _author_to_schema(author: Author) -> AuthorSchema:
+    """
+    Build an AuthorSchema from an author model.
+
+    Outside a quote there is no language to pick the name by, so
+    ``name`` is the English name, falling back to the Russian one.
+
+    Args:
+        author: Author model
+
+    Returns:
+        Author schema
+    """
+    return AuthorSchema(
+        id=author.id,
+        name=author.name_en or author.name_ru or "",
+        name_en=author.name_en,
+        name_ru=author.name_ru,
+        bio=author.bio
+    )
+
+
 @router.get("", response_model=list[AuthorSchema])
+@cached(
+    "authors",
+    ttl=60,
+    local_key=lambda params: ((params["name"] or "").lower(), params["limit"])
+)
 def search_authors(
     name: Optional[str] = Query(None, description="Author name search"),
     limit: int = Query(20, ge=1, le=100, description="Result limit"),
     db: Session = Depends(get_db)
 ) -> list[AuthorSchema]:
     """
-    Search authors.
+    Search authors (autocomplete, cached briefly).
 
     Args:
         name: Author name search term
@@ -31,47 +59,42 @@ def search_authors(
     Returns:
         List of matching authors
     """
-    try:
-        author_repo = AuthorRepository(db)
+    author_repo = AuthorRepository(db)
 
-        if name:
-            authors = author_repo.search(name, limit=limit)
-        else:
-            # Return empty list if no search term
-            authors = []
+    if name:
+        authors = author_repo.search(name, limit=limit)
+    else:
+        # Return empty list if no search term
+        authors = []
 
-        return authors
-    except Exception as e:
-        logger.error(f"Search authors endpoint error: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    # Serialize while the session is open so the result can be cached
+    return [_author_to_schema(author) for author in authors]
 
 
 @router.get("/{author_id}", response_model=AuthorSchema)
 def get_author(
     author_id: int,
+    request: Request,
     db: Session = Depends(get_db)
-) -> AuthorSchema:
+) -> Response:
     """
     Get author by ID.
 
+    The response carries an ETag, so repeat views get a 304.
+
     Args:
         author_id: Author ID
+        request: Incoming request
         db: Database session
 
     Returns:
-        Author object
+        Author JSON response
     """
-    try:
-        author_repo = AuthorRepository(db)
-        author = author_repo.get_by_id(author_id)
-
-        if not author:
-            raise HTTPException(status_code=404, detail="Author not found")
-
-        return author
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Get author endpoint error: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    author_repo = AuthorRepository(db)
+    author = author_repo.get_by_id(author_id)
+
+    if not author:
+        raise HTTPException(status_code=404, detail="Author not found")
+
+    return etag_response(request, _author_to_schema(author))
 
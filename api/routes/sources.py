@@ -3,25 +3,30 @@ Source API routes.
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from database import get_db
 from repositories.source_repository import SourceRepository
 from api.models.schemas import SourceSchema
-from logger_config import logger
+from utils.cache import cached, etag_response
 
 router = APIRouter()
 
 
 @router.get("", response_model=list[SourceSchema])
+@cached(
+    "sources",
+    ttl=60,
+    local_key=lambda params: ((params["title"] or "").lower(), params["limit"])
+)
 def search_sources(
     title: Optional[str] = Query(None, description="Source title search"),
     limit: int = Query(20, ge=1, le=100, description="Result limit"),
     db: Session = Depends(get_db)
 ) -> list[SourceSchema]:
     """
-    Search sources.
+    Search sources (autocomplete, cached briefly).
 
     Args:
         title: Source title search term
@@ -31,47 +36,42 @@ def search_sources(
     Returns:
         List of matching sources
     """
-    try:
-        source_repo = SourceRepository(db)
+    source_repo = SourceRepository(db)
 
-        if title:
-            sources = source_repo.search(title, limit=limit)
-        else:
-            # Return empty list if no search term
-            sources = []
+    if title:
+        sources = source_repo.search(title, limit=limit)
+    else:
+        # Return empty list if no search term
+        sources = []
 
-        return sources
-    except Exception as e:
-        logger.error(f"Search sources endpoint error: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    # Serialize while the session is open so the result can be cached
+    return [SourceSchema.model_validate(source) for source in sources]
 
 
 @router.get("/{source_id}", response_model=SourceSchema)
 def get_source(
     source_id: int,
+    request: Request,
     db: Session = Depends(get_db)
-) -> SourceSchema:
+) -> Response:
     """
     Get source by ID.
 
+    The response carries an ETag, so repeat views get a 304.
+
     Args:
         source_id: Source ID
+        request: Incoming request
         db: Database session
 
     Returns:
-        Source object
+        Source JSON response
     """
-    try:
-        source_repo = SourceRepository(db)
-        source = source_repo.get_by_id(source_id)
-
-        if not source:
-            raise HTTPException(status_code=404, detail="Source not found")
-
-        return source
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Get source endpoint error: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    source_repo = SourceRepository(db)
+    source = source_repo.get_by_id(source_id)
+
+    if not source:
+        raise HTTPException(status_code=404, detail="Source not found")
+
+    return etag_response(request, SourceSchema.model_validate(source))
 
@@ -2,6 +2,7 @@
 Check how many Russian quotes don't have English translations.
 """
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from database import SessionLocal
 from models import Quote, QuoteTranslation
@@ -13,58 +14,57 @@ def check_ru_quotes_without_en():
     db = SessionLocal()
     
     try:
-        # Get all Russian quotes
-        all_ru_quotes = db.query(Quote).filter(Quote.language == 'ru').all()
+        # Bilingual groups that contain an English quote
+        en_group_ids = {
+            group_id for (group_id,) in db.query(Quote.bilingual_group_id)
+            .filter(
+                Quote.language == 'en',
+                Quote.bilingual_group_id.isnot(None)
+            )
+            .distinct()
+        }
         
-        quotes_without_en = []
-        quotes_with_en = []
+        # Quotes linked to an English quote via QuoteTranslation
+        translated_ids = {
+            quote_id for (quote_id,) in db.query(QuoteTranslation.quote_id)
+            .join(Quote, QuoteTranslation.translated_quote_id == Quote.id)
+            .filter(Quote.language == 'en')
+            .distinct()
+        }
         
-        for ru_quote in all_ru_quotes:
-            has_en_translation = False
-            
-            # Check bilingual_group_id
-            if ru_quote.bilingual_group_id:
-                en_quote = db.query(Quote).filter(
-                    Quote.bilingual_group_id == ru_quote.bilingual_group_id,
-                    Quote.language == 'en'
-                ).first()
-                
-                if en_quote:
-                    has_en_translation = True
-            
-            # Check QuoteTranslation table
-            if not has_en_translation:
-                translation = db.query(QuoteTranslation).filter(
-                    QuoteTranslation.quote_id == ru_quote.id
-                ).join(
-                    Quote,
-                    QuoteTranslation.translated_quote_id == Quote.id
-                ).filter(
-                    Quote.language == 'en'
-                ).first()
-                
-                if translation:
-                    has_en_translation = True
-            
-            if has_en_translation:
-                quotes_with_en.append(ru_quote)
+        with_en_count = 0
+        without_en_count = 0
+        samples_without_en = []
+        
+        # Single streamed pass over Russian quotes as plain row tuples
+        # (no ORM instances or identity map), with membership checks only
+        ru_rows = db.execute(
+            select(Quote.id, Quote.text, Quote.bilingual_group_id)
+            .where(Quote.language == 'ru')
+            .execution_options(yield_per=1000)
+        )
+        for quote_id, text, group_id in ru_rows:
+            if group_id in en_group_ids or quote_id in translated_ids:
+                with_en_count += 1
             else:
-                quotes_without_en.append(ru_quote)
+                without_en_count += 1
+                if len(samples_without_en) < 10:
+                    samples_without_en.append((quote_id, text))
         
         print("=" * 60)
         print("Russian Quotes Translation Status")
         print("=" * 60)
-        print(f"Total Russian quotes: {len(all_ru_quotes)}")
-        print(f"Quotes WITH English translation: {len(quotes_with_en)}")
-        print(f"Quotes WITHOUT English translation: {len(quotes_without_en)}")
+        print(f"Total Russian quotes: {with_en_count + without_en_count}")
+        print(f"Quotes WITH English translation: {with_en_count}")
+        print(f"Quotes WITHOUT English translation: {without_en_count}")
         print("=" * 60)
         
-        if quotes_without_en:
+        if samples_without_en:
             print(f"\nFirst 10 Russian quotes without English translations:")
-            for i, quote in enumerate(quotes_without_en[:10], 1):
-                print(f"{i}. ID {quote.id}: {quote.text[:80]}...")
+            for i, (quote_id, text) in enumerate(samples_without_en, 1):
+                print(f"{i}. ID {quote_id}: {text[:80]}...")
         
-        return len(quotes_without_en)
+        return without_en_count
         
     except Exception as e:
         logger.error(f"Error checking quotes: {e}")
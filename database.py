@@ -4,23 +4,81 @@ Database connection and session management.
 Provides SQLAlchemy engine, session factory, and base model class.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import NullPool
+from typing import Generator, Optional
 
 from config import settings
 from logger_config import logger
 
+# Database type, for code paths that differ between SQLite and PostgreSQL
+IS_SQLITE = make_url(settings.database_url).get_backend_name() == "sqlite"
+
+# Connection pool sizing (SQLite uses its own single-file pooling)
+if IS_SQLITE:
+    pool_options = {}
+else:
+    pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        # Reuse the most recently returned connection; idle extras expire
+        "pool_use_lifo": True,
+    }
+
+# psycopg2: send executemany() UPDATE/DELETE as multi-statement batches
+# (INSERTs already use multi-row VALUES); psycopg 3 pipelines by itself
+if make_url(settings.database_url).get_driver_name() == "psycopg2":
+    driver_options = {
+        "executemany_mode": "values_plus_batch",
+        "executemany_batch_page_size": 1000,
+    }
+else:
+    driver_options = {}
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
-    echo=False  # Set to True for SQL query logging
+    query_cache_size=settings.db_query_cache_size,
+    echo=False,  # Set to True for SQL query logging
+    **pool_options,
+    **driver_options
+)
+
+# Engine for batch scripts (exports, dedup, word loading): they hold one
+# connection for their whole run, so pooling only keeps it open after
+# they finish
+batch_engine = create_engine(
+    settings.database_url,
+    poolclass=NullPool,
+    echo=False,
+    **driver_options
 )
 
-# Session factory
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Set journaling pragmas on each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+# SQLite: write-ahead log, fsync only at checkpoints
+if IS_SQLITE:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(batch_engine, "connect", _set_sqlite_pragmas)
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+BatchSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=batch_engine
+)
 
 # Base class for models
 Base = declarative_base()
@@ -44,14 +102,18 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def init_db() -> None:
+def init_db(bind: Optional[Connection] = None) -> None:
     """
     Initialize database tables.
 
     Creates all tables defined in models.
+
+    Args:
+        bind: Optional open connection to use instead of a new one from
+            the engine (the caller commits)
     """
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=bind if bind is not None else engine)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Failed to create database tables: {e}")
@@ -7,9 +7,9 @@ one quote per line.
 
 from pathlib import Path
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 
-from database import SessionLocal
+from database import BatchSessionLocal
 from models import Quote
 from logger_config import setup_logging
 
@@ -17,6 +17,12 @@ from logger_config import setup_logging
 log_file = Path("logs") / f"export_en_quotes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 logger = setup_logging(log_level="INFO", log_file=str(log_file))
 
+# Write buffer size (the 8 KiB default means one syscall per ~100 quotes)
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Rows fetched per keyset page (bounds memory on every driver)
+EXPORT_PAGE_SIZE = 10000
+
 
 def export_english_quotes(output_file: str = None):
     """
@@ -37,30 +43,41 @@ def export_english_quotes(output_file: str = None):
     logger.info(f"Output file: {output_file}")
     
     # Get database session
-    db = SessionLocal()
+    db = BatchSessionLocal()
     
     try:
-        # Get all English quotes
-        quotes = db.query(Quote).filter(Quote.language == 'en').order_by(Quote.id).all()
-        
-        logger.info(f"Found {len(quotes)} English quotes in database")
+        # Write quotes to file one keyset page at a time
+        exported = 0
+        last_id = 0
+        with open(
+            output_file, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE
+        ) as f:
+            while True:
+                # Range scan on idx_quotes_language_id; no open cursor
+                # or snapshot is held between pages
+                rows = db.execute(
+                    select(Quote.id, Quote.text)
+                    .where(Quote.language == 'en', Quote.id > last_id)
+                    .order_by(Quote.id)
+                    .limit(EXPORT_PAGE_SIZE)
+                ).all()
+                if not rows:
+                    break
+                
+                # Write quote text, one per line
+                f.writelines(f"{text.strip()}\n" for _, text in rows)
+                last_id = rows[-1].id
+                exported += len(rows)
+                logger.info(f"Exported {exported} quotes...")
         
-        if not quotes:
+        if not exported:
+            output_path.unlink()
             logger.warning("No English quotes found in database")
             return
         
-        # Write quotes to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for idx, quote in enumerate(quotes, 1):
-                # Write quote text, one per line
-                f.write(quote.text.strip() + '\n')
-                
-                if idx % 100 == 0:
-                    logger.info(f"Exported {idx}/{len(quotes)} quotes...")
-        
         logger.info("=" * 60)
         logger.info("Export completed!")
-        logger.info(f"Total quotes exported: {len(quotes)}")
+        logger.info(f"Total quotes exported: {exported}")
         logger.info(f"Output file: {output_file}")
         logger.info("=" * 60)
         
@@ -9,112 +9,29 @@ using multiple similarity methods: exact match, token overlap, and fuzzy matchin
 import sys
 import csv
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func
+from sqlalchemy import (
+    Column, Integer, MetaData, Table, delete, insert, select, update
+)
 
-from database import SessionLocal
+from database import BatchSessionLocal
 from models import Quote
+from repositories.quote_repository import QuoteRepository
 from services.quote_deduplicator import QuoteDeduplicator
-from logger_config import setup_logging
+from services.quote_deduplicator_exact import find_exact_duplicates
+from logger_config import logger, setup_logging
 
-# Setup logging
-log_file = Path("logs") / f"deduplicate_quotes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-logger = setup_logging(log_level="INFO", log_file=str(log_file))
-
-
-def find_exact_duplicates(db) -> list:
-    """
-    Find exact duplicate quotes (legacy method for backward compatibility).
-    
-    Returns:
-        List of duplicate groups
-    """
-    from sqlalchemy import func
-    
-    # Check database type
-    from database import engine
-    is_sqlite = 'sqlite' in str(engine.url).lower()
-    
-    if is_sqlite:
-        # SQLite: get all quotes and group in Python
-        all_quotes = db.query(Quote).all()
-        quote_groups = {}
-        
-        for quote in all_quotes:
-            normalized_text = quote.text.strip().lower()
-            key = (normalized_text, quote.author_id, quote.language)
-            
-            if key not in quote_groups:
-                quote_groups[key] = []
-            quote_groups[key].append(quote.id)
-        
-        # Filter to only groups with duplicates
-        duplicates = []
-        for key, ids in quote_groups.items():
-            if len(ids) > 1:
-                class DuplicateGroup:
-                    def __init__(self, text, author_id, lang, count, ids):
-                        self.normalized_text = text
-                        self.author_id = author_id
-                        self.language = lang
-                        self.count = count
-                        self.ids = ids
-                
-                duplicates.append(
-                    DuplicateGroup(key[0], key[1], key[2], len(ids), ids)
-                )
-    else:
-        # PostgreSQL: use array_agg
-        try:
-            duplicates = (
-                db.query(
-                    func.lower(func.trim(Quote.text)).label('normalized_text'),
-                    Quote.author_id,
-                    Quote.language,
-                    func.count(Quote.id).label('count'),
-                    func.array_agg(Quote.id).label('ids')
-                )
-                .group_by(
-                    func.lower(func.trim(Quote.text)),
-                    Quote.author_id,
-                    Quote.language
-                )
-                .having(func.count(Quote.id) > 1)
-                .all()
-            )
-        except Exception as e:
-            logger.warning(f"PostgreSQL query failed, falling back to Python grouping: {e}")
-            # Fallback to Python grouping
-            all_quotes = db.query(Quote).all()
-            quote_groups = {}
-            
-            for quote in all_quotes:
-                normalized_text = quote.text.strip().lower()
-                key = (normalized_text, quote.author_id, quote.language)
-                
-                if key not in quote_groups:
-                    quote_groups[key] = []
-                quote_groups[key].append(quote.id)
-            
-            duplicates = []
-            for key, ids in quote_groups.items():
-                if len(ids) > 1:
-                    class DuplicateGroup:
-                        def __init__(self, text, author_id, lang, count, ids):
-                            self.normalized_text = text
-                            self.author_id = author_id
-                            self.language = lang
-                            self.count = count
-                            self.ids = ids
-                    
-                    duplicates.append(
-                        DuplicateGroup(key[0], key[1], key[2], len(ids), ids)
-                    )
-    
-    return duplicates
+# Similar-pairs CSV report columns and write buffer size
+REPORT_FIELDS = (
+    'language', 'quote1_id', 'quote1_text', 'quote2_id', 'quote2_text',
+    'similarity_score', 'method'
+)
+REPORT_BUFFER_SIZE = 1024 * 1024
 
 
 def remove_duplicates(db, dry_run: bool = True) -> dict:
@@ -141,6 +58,9 @@ def remove_duplicates(db, dry_run: bool = True) -> dict:
     
     logger.info(f"Found {len(duplicates)} groups of exact duplicate quotes")
     
+    # Removed quote id -> kept quote id rows for the id_map temp table
+    id_map = []
+    
     for dup in duplicates:
         normalized_text = dup.normalized_text
         author_id = dup.author_id
@@ -148,20 +68,7 @@ def remove_duplicates(db, dry_run: bool = True) -> dict:
         count = dup.count
         
         # Get all quote IDs for this duplicate group
-        if hasattr(dup, 'ids') and isinstance(dup.ids, list):
-            quote_ids = sorted(dup.ids)
-        else:
-            quote_ids = (
-                db.query(Quote.id)
-                .filter(
-                    func.lower(func.trim(Quote.text)) == normalized_text,
-                    Quote.author_id == author_id,
-                    Quote.language == language
-                )
-                .order_by(Quote.id)
-                .all()
-            )
-            quote_ids = [qid[0] if isinstance(qid, tuple) else qid.id for qid in quote_ids]
+        quote_ids = sorted(dup.ids)
         
         # Keep the first one (lowest ID), remove the rest
         keep_id = quote_ids[0]
@@ -169,38 +76,104 @@ def remove_duplicates(db, dry_run: bool = True) -> dict:
         
         stats['quotes_to_remove'] += len(remove_ids)
         
+        # Lazy %-formatting: arguments are only formatted if emitted
         logger.info(
-            f"Duplicate group: '{normalized_text[:50]}...' "
-            f"(author_id={author_id}, lang={language}) - "
-            f"keeping ID {keep_id}, removing {len(remove_ids)} duplicates"
+            "Duplicate group: '%s...' (author_id=%s, lang=%s) - "
+            "keeping ID %s, removing %d duplicates",
+            normalized_text[:50], author_id, language,
+            keep_id, len(remove_ids)
         )
         
-        if not dry_run:
-            for remove_id in remove_ids:
-                # Update translations that point to the quote we're removing
-                db.query(QuoteTranslation).filter(
-                    QuoteTranslation.translated_quote_id == remove_id
-                ).update({
-                    QuoteTranslation.translated_quote_id: keep_id
-                })
-                
-                # Update translations from the quote we're removing
-                db.query(QuoteTranslation).filter(
-                    QuoteTranslation.quote_id == remove_id
-                ).update({
-                    QuoteTranslation.quote_id: keep_id
-                })
-                
-                # Delete the duplicate quote
-                db.query(Quote).filter(Quote.id == remove_id).delete()
-                stats['quotes_removed'] += 1
-            
-            db.commit()
-            logger.info(f"Removed {len(remove_ids)} duplicate quotes")
+        id_map.extend(
+            {'old_id': remove_id, 'new_id': keep_id}
+            for remove_id in remove_ids
+        )
+    
+    if not dry_run and id_map:
+        # Load the mapping into a temp table (one multi-row INSERT), then
+        # re-link and delete with three set-based statements and commit once
+        translations = QuoteTranslation.__table__
+        quotes = Quote.__table__
+        id_map_table = Table(
+            'id_map', MetaData(),
+            Column('old_id', Integer, primary_key=True, autoincrement=False),
+            Column('new_id', Integer, nullable=False),
+            prefixes=['TEMPORARY']
+        )
+        id_map_table.create(db.connection())
+        db.execute(insert(id_map_table), id_map)
+        old_ids = select(id_map_table.c.old_id)
+        
+        def new_id_for(column):
+            """Correlated lookup of the kept quote id for a removed id."""
+            return (
+                select(id_map_table.c.new_id)
+                .where(id_map_table.c.old_id == column)
+                .scalar_subquery()
+            )
+        
+        # Update translations that point to the quotes we're removing
+        db.execute(
+            update(translations)
+            .where(translations.c.translated_quote_id.in_(old_ids))
+            .values(
+                translated_quote_id=new_id_for(
+                    translations.c.translated_quote_id
+                )
+            )
+        )
+        
+        # Update translations from the quotes we're removing
+        db.execute(
+            update(translations)
+            .where(translations.c.quote_id.in_(old_ids))
+            .values(quote_id=new_id_for(translations.c.quote_id))
+        )
+        
+        # Delete the duplicate quotes
+        db.execute(delete(quotes).where(quotes.c.id.in_(old_ids)))
+        id_map_table.drop(db.connection())
+        db.commit()
+        
+        stats['quotes_removed'] = len(id_map)
+        logger.info(f"Removed {len(id_map)} duplicate quotes")
+        
+        # Removed quotes may still be listed in the pairs view
+        QuoteRepository(db).refresh_bilingual_pairs()
     
     return stats
 
 
+def _find_similar_pairs(
+    language: str,
+    token_threshold: float,
+    fuzzy_threshold: float
+) -> list:
+    """
+    Find similar quote pairs for one language in a separate session.
+    
+    Runs in a worker process, so it opens its own database connection.
+    
+    Args:
+        language: Language code ('en' or 'ru')
+        token_threshold: Token overlap threshold (0.0-1.0)
+        fuzzy_threshold: Fuzzy match threshold (0.0-1.0)
+        
+    Returns:
+        List of (quote1, quote2, similarity_score, method) tuples
+    """
+    db = BatchSessionLocal()
+    try:
+        deduplicator = QuoteDeduplicator(
+            db=db,
+            token_threshold=token_threshold,
+            fuzzy_threshold=fuzzy_threshold
+        )
+        return deduplicator.find_similar_quotes(language)
+    finally:
+        db.close()
+
+
 def deduplicate_similar_quotes(
     db,
     language: Optional[str] = None,
@@ -247,56 +220,80 @@ def deduplicate_similar_quotes(
         # Process both languages
         languages_to_process = ['en', 'ru']
     
-    # Collect similar pairs for CSV report
-    similar_pairs_report = []
-    
-    for lang in languages_to_process:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing {lang.upper()} quotes...")
-        logger.info(f"{'='*60}")
-        
-        # Find similar pairs for reporting
-        similar_pairs = deduplicator.find_similar_quotes(lang)
-        
-        # Add to report
-        for quote1, quote2, score, method in similar_pairs:
-            similar_pairs_report.append({
-                'language': lang,
-                'quote1_id': quote1.id,
-                'quote1_text': quote1.text[:200],
-                'quote2_id': quote2.id,
-                'quote2_text': quote2.text[:200],
-                'similarity_score': f"{score:.3f}",
-                'method': method
-            })
-        
-        # Deduplicate
-        stats = deduplicator.deduplicate_by_language(lang, dry_run=dry_run)
-        all_stats['languages'][lang] = stats
-        
-        # Aggregate statistics
-        all_stats['total_quotes_processed'] += stats['quotes_processed']
-        all_stats['total_similar_pairs_found'] += stats['similar_pairs_found']
-        all_stats['total_duplicate_groups'] += stats['duplicate_groups']
-        all_stats['total_quotes_merged'] += stats['quotes_merged']
-        all_stats['total_quotes_removed'] += stats['quotes_removed']
-        all_stats['total_translation_links_updated'] += stats['translation_links_updated']
-        all_stats['total_bilingual_groups_merged'] += stats['bilingual_groups_merged']
-    
-    # Save CSV report if requested
-    if report_csv and similar_pairs_report:
+    # Stream similar pairs to the CSV report as each language is processed
+    report_file = None
+    report_writer = None
+    if report_csv:
         report_path = Path(report_csv)
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(report_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'language', 'quote1_id', 'quote1_text', 'quote2_id', 'quote2_text',
-                'similarity_score', 'method'
-            ])
-            writer.writeheader()
-            writer.writerows(similar_pairs_report)
-        
-        logger.info(f"Duplicate report saved to: {report_csv}")
+        report_file = open(
+            report_path, 'w', encoding='utf-8', newline='',
+            buffering=REPORT_BUFFER_SIZE
+        )
+        report_writer = csv.writer(report_file)
+        report_writer.writerow(REPORT_FIELDS)
+    
+    # Similarity search is read-only, CPU-bound Python: search each
+    # language in its own process; merges below stay sequential
+    if len(languages_to_process) > 1:
+        with ProcessPoolExecutor(
+            max_workers=len(languages_to_process)
+        ) as executor:
+            pairs_by_language = dict(zip(
+                languages_to_process,
+                executor.map(
+                    _find_similar_pairs,
+                    languages_to_process,
+                    repeat(token_threshold),
+                    repeat(fuzzy_threshold)
+                )
+            ))
+    else:
+        pairs_by_language = {
+            lang: deduplicator.find_similar_quotes(lang)
+            for lang in languages_to_process
+        }
+    
+    try:
+        for lang in languages_to_process:
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Processing {lang.upper()} quotes...")
+            logger.info(f"{'='*60}")
+            
+            # Similar pairs for reporting
+            similar_pairs = pairs_by_language[lang]
+            
+            # Add to report
+            if report_writer:
+                report_writer.writerows(
+                    (
+                        lang,
+                        quote1.id, quote1.text[:200],
+                        quote2.id, quote2.text[:200],
+                        f"{score:.3f}",
+                        method
+                    )
+                    for quote1, quote2, score, method in similar_pairs
+                )
+            
+            # Deduplicate
+            stats = deduplicator.deduplicate_by_language(
+                lang, dry_run=dry_run, similar_pairs=similar_pairs
+            )
+            all_stats['languages'][lang] = stats
+            
+            # Aggregate statistics
+            all_stats['total_quotes_processed'] += stats['quotes_processed']
+            all_stats['total_similar_pairs_found'] += stats['similar_pairs_found']
+            all_stats['total_duplicate_groups'] += stats['duplicate_groups']
+            all_stats['total_quotes_merged'] += stats['quotes_merged']
+            all_stats['total_quotes_removed'] += stats['quotes_removed']
+            all_stats['total_translation_links_updated'] += stats['translation_links_updated']
+            all_stats['total_bilingual_groups_merged'] += stats['bilingual_groups_merged']
+    finally:
+        if report_file:
+            report_file.close()
+            logger.info(f"Duplicate report saved to: {report_csv}")
     
     return all_stats
 
@@ -343,6 +340,11 @@ def print_statistics(stats: dict, dry_run: bool = False):
 
 def main():
     """Main entry point."""
+    # Setup logging here, not at import: similarity workers import this
+    # module and would each open their own timestamped log file
+    log_file = Path("logs") / f"deduplicate_quotes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    setup_logging(log_level="INFO", log_file=str(log_file))
+    
     parser = argparse.ArgumentParser(
         description='Find and remove duplicate quotes from the database',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -418,7 +420,7 @@ Examples:
         print("EXECUTE MODE - Duplicates will be removed!")
         print()
     
-    db = SessionLocal()
+    db = BatchSessionLocal()
     
     try:
         if args.exact_only:
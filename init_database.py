@@ -4,8 +4,16 @@ Initialize database with tables and indexes.
 Run this script to set up the database schema.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from sqlalchemy import text
-from database import engine, init_db
+from sqlalchemy.engine import Connection
+from database import IS_SQLITE, engine, init_db
 from logger_config import logger
 
 # Import all models to ensure they're registered with Base.metadata
@@ -13,68 +21,345 @@ from models import (  # noqa: F401
     Author, Source, Quote, QuoteTranslation, WordTranslation
 )
 
+# Alembic migration scripts (init_database leaves them at head)
+ALEMBIC_DIR = Path(__file__).resolve().parent / "alembic"
 
-def create_search_indexes() -> None:
+# PostgreSQL full-text search DDL, sent in one round-trip
+SEARCH_DDL = """
+-- Language-agnostic search vector ('simple' config works for both
+-- English and Russian), computed by the executor on every write.
+-- Older databases kept it up to date with a plpgsql trigger; replace
+-- that plain column with the generated one.
+DROP TRIGGER IF EXISTS tsvector_update_quote ON quotes;
+DROP FUNCTION IF EXISTS update_quote_search_vector();
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'quotes'
+          AND column_name = 'search_vector'
+          AND is_generated = 'NEVER'
+    ) THEN
+        ALTER TABLE quotes DROP COLUMN search_vector;
+    END IF;
+END
+$$;
+ALTER TABLE quotes ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (to_tsvector('simple', text)) STORED;
+
+-- Per-language generated tsvector columns used by PostgreSQLSearchStrategy
+-- (same DDL as the add_language_tsvectors Alembic revision)
+ALTER TABLE quotes ADD COLUMN IF NOT EXISTS text_tsv_en tsvector
+GENERATED ALWAYS AS (to_tsvector('english', text)) STORED;
+ALTER TABLE quotes ADD COLUMN IF NOT EXISTS text_tsv_ru tsvector
+GENERATED ALWAYS AS (to_tsvector('russian', text)) STORED;
+
+-- Precomputed EN/RU pairs for /api/quotes/bilingual/pairs
+-- (same DDL as the add_bilingual_pairs_view Alembic revision)
+CREATE MATERIALIZED VIEW IF NOT EXISTS bilingual_pairs AS
+SELECT en.bilingual_group_id AS group_id,
+       min(en.id) AS en_id,
+       min(ru.id) AS ru_id
+FROM quotes en
+JOIN quotes ru ON ru.bilingual_group_id = en.bilingual_group_id
+WHERE en.language = 'en' AND ru.language = 'ru'
+GROUP BY en.bilingual_group_id;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_bilingual_pairs_group
+ON bilingual_pairs(group_id);
+-- A view kept by IF NOT EXISTS holds the pairs of its last refresh
+REFRESH MATERIALIZED VIEW CONCURRENTLY bilingual_pairs;
+"""
+
+# GIN indexes on the per-language columns, built without blocking writes
+TSV_INDEX_DDL = {
+    "idx_quotes_tsv_en": (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_quotes_tsv_en "
+        "ON quotes USING GIN(text_tsv_en)"
+    ),
+    "idx_quotes_tsv_ru": (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_quotes_tsv_ru "
+        "ON quotes USING GIN(text_tsv_ru)"
+    ),
+}
+
+# Session settings for index builds: sort in memory instead of spilling
+# to disk, and let B-tree builds use parallel workers
+INDEX_BUILD_SETTINGS = {
+    "maintenance_work_mem": "1GB",
+    "max_parallel_maintenance_workers": "4",
+}
+
+SET_SESSION_SETTING = text("SELECT set_config(:name, :value, false)")
+
+# False for an index left behind by a failed concurrent build
+INDEX_IS_VALID = text(
+    "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+)
+
+ANALYZE_QUOTES = text("ANALYZE quotes")
+QUOTES_ROW_ESTIMATE = text(
+    "SELECT reltuples FROM pg_class WHERE oid = to_regclass('quotes')"
+)
+
+# Whether a table has a column, in a single catalog lookup
+COLUMN_EXISTS = text("""
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = current_schema()
+      AND table_name = :table
+      AND column_name = :column
+""")
+SQLITE_COLUMN_EXISTS = text(
+    "SELECT 1 FROM pragma_table_info(:table) WHERE name = :column"
+)
+
+# quotes.bilingual_group_id for databases created before the column
+ADD_BILINGUAL_COLUMN = text(
+    "ALTER TABLE quotes ADD COLUMN bilingual_group_id INTEGER"
+)
+
+# Indexes on quotes.bilingual_group_id: name -> indexed columns
+BILINGUAL_INDEXES = {
+    "idx_quotes_bilingual_group": "quotes(bilingual_group_id)",
+    "idx_quotes_group_language": "quotes(bilingual_group_id, language)",
+}
+
+# (language, id) replaces the single-column language index
+CREATE_LANGUAGE_ID_INDEX = text(
+    "CREATE INDEX IF NOT EXISTS idx_quotes_language_id ON quotes(language, id)"
+)
+DROP_LANGUAGE_INDEX = text("DROP INDEX IF EXISTS idx_quotes_language")
+
+# Access methods accepted for idx_quotes_search_vector
+SEARCH_INDEX_TYPES = ("gin", "gist")
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
     """
-    Create PostgreSQL full-text search indexes.
+    Check whether a table has a column.
+
+    One query instead of the inspector's full column reflection.
+
+    Args:
+        conn: Open connection
+        table: Table name
+        column: Column name
+
+    Returns:
+        True if the column exists
+    """
+    query = SQLITE_COLUMN_EXISTS if IS_SQLITE else COLUMN_EXISTS
+    return conn.execute(
+        query, {"table": table, "column": column}
+    ).first() is not None
+
+
+def _alembic_config(conn: Connection) -> Config:
+    """
+    Build an Alembic config that migrates over an open connection.
+
+    No ini file is loaded, so Alembic leaves logging alone; alembic/env.py
+    picks the connection up from config.attributes.
+
+    Args:
+        conn: Open connection with no transaction in progress
+
+    Returns:
+        Alembic config
+    """
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.attributes["connection"] = conn
+    return config
+
+
+def search_index_ddl(
+    index_type: str = "gin",
+    partial_pred: Optional[str] = None,
+    fastupdate: bool = True
+) -> str:
+    """
+    Build the CREATE INDEX CONCURRENTLY statement for quotes.search_vector.
+
+    GIN is fastest to search; GiST builds and updates faster, for
+    write-heavy databases. A partial predicate keeps rows that are
+    never searched out of the index.
+
+    Args:
+        index_type: Index access method ('gin' or 'gist')
+        partial_pred: Optional SQL predicate, e.g. "language IN ('en', 'ru')"
+        fastupdate: GIN only; False writes entries straight into the index
+            instead of a pending list, avoiding cleanup stalls on bursty writes
+
+    Returns:
+        CREATE INDEX CONCURRENTLY statement
+
+    Raises:
+        ValueError: If index_type is not supported
+    """
+    if index_type not in SEARCH_INDEX_TYPES:
+        raise ValueError(
+            f"Unsupported search index type '{index_type}', "
+            f"expected one of {SEARCH_INDEX_TYPES}"
+        )
+
+    ddl = (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_quotes_search_vector "
+        f"ON quotes USING {index_type.upper()}(search_vector)"
+    )
+    if index_type == "gin" and not fastupdate:
+        ddl += " WITH (fastupdate = off)"
+    if partial_pred:
+        ddl += f" WHERE ({partial_pred})"
+    return ddl
+
+
+def build_index_concurrently(conn, name: str, ddl: str) -> None:
+    """
+    Run a CREATE INDEX CONCURRENTLY statement.
 
-    This function creates the GIN index for full-text search
-    and sets up triggers to update search vectors automatically.
+    A failed concurrent build leaves an invalid index behind, which
+    IF NOT EXISTS would then skip forever; such an index is dropped
+    and built again. INDEX_BUILD_SETTINGS apply for the build only.
+
+    Args:
+        conn: Connection in AUTOCOMMIT mode
+        name: Index name
+        ddl: CREATE INDEX CONCURRENTLY IF NOT EXISTS statement
     """
+    # Session-level: SET LOCAL has no effect outside a transaction
+    for setting, value in INDEX_BUILD_SETTINGS.items():
+        conn.execute(SET_SESSION_SETTING, {"name": setting, "value": value})
+
     try:
+        if conn.execute(INDEX_IS_VALID, {"name": name}).scalar() is False:
+            logger.warning(f"Rebuilding invalid index {name}")
+            conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        conn.exec_driver_sql(ddl)
+
+        if conn.execute(INDEX_IS_VALID, {"name": name}).scalar() is False:
+            raise RuntimeError(
+                f"Index {name} is invalid after a concurrent build"
+            )
+    finally:
+        # The connection goes back to the pool afterwards
+        for setting in INDEX_BUILD_SETTINGS:
+            conn.exec_driver_sql(f"RESET {setting}")
+
+
+def build_indexes_concurrently(index_ddl: dict[str, str]) -> None:
+    """
+    Build several indexes in parallel, one pooled connection each.
+
+    Args:
+        index_ddl: Index name -> CREATE INDEX CONCURRENTLY statement
+    """
+    autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    def build(name: str, ddl: str) -> None:
+        with autocommit_engine.connect() as conn:
+            build_index_concurrently(conn, name, ddl)
+
+    with ThreadPoolExecutor(max_workers=len(index_ddl)) as executor:
+        futures = [
+            executor.submit(build, name, ddl)
+            for name, ddl in index_ddl.items()
+        ]
+        for future in futures:
+            future.result()
+
+
+def create_search_indexes(
+    index_type: str = "gin",
+    partial_pred: Optional[str] = None,
+    fastupdate: bool = True,
+    conn: Optional[Connection] = None
+) -> None:
+    """
+    Create PostgreSQL full-text search indexes.
+
+    This function creates the generated search_vector column and
+    its full-text search index. An existing idx_quotes_search_vector
+    is kept as is; drop it first to change its type or predicate.
+
+    Args:
+        index_type: search_vector index access method ('gin' or 'gist')
+        partial_pred: Optional predicate for a partial search_vector index
+        fastupdate: Keep the GIN pending list (see search_index_ddl)
+        conn: Optional open connection with no transaction in progress;
+            a new one is taken from the engine if omitted
+    """
+    if engine.dialect.name != "postgresql":
+        logger.info(
+            f"Skipping PostgreSQL search indexes "
+            f"(dialect={engine.dialect.name})"
+        )
+        return
+
+    if conn is None:
         with engine.connect() as conn:
-            # Create GIN index for full-text search
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_quotes_search_vector
-                ON quotes USING GIN(search_vector);
-            """))
-
-            # Create function to update search vector
-            # Use 'simple' config for language-agnostic search
-            conn.execute(text("""
-                CREATE OR REPLACE FUNCTION update_quote_search_vector()
-                RETURNS TRIGGER AS $$
-                BEGIN
-                    -- Use 'simple' config for language-agnostic search
-                    -- This works for both English and Russian
-                    NEW.search_vector := to_tsvector('simple', NEW.text);
-                    RETURN NEW;
-                END;
-                $$ LANGUAGE plpgsql;
-            """))
-
-            # Create trigger to auto-update search vector
-            conn.execute(text("""
-                DROP TRIGGER IF EXISTS tsvector_update_quote ON quotes;
-                CREATE TRIGGER tsvector_update_quote
-                BEFORE INSERT OR UPDATE ON quotes
-                FOR EACH ROW
-                EXECUTE FUNCTION update_quote_search_vector();
-            """))
-
-            # Update existing quotes
-            conn.execute(text("""
-                UPDATE quotes
-                SET search_vector = to_tsvector('simple', text)
-                WHERE search_vector IS NULL;
-            """))
+            create_search_indexes(index_type, partial_pred, fastupdate, conn)
+        return
 
-            conn.commit()
-            logger.info("Search indexes and triggers created successfully")
+    try:
+        # One transaction; all DDL goes to the server as a single batch
+        conn.exec_driver_sql(SEARCH_DDL)
+        conn.commit()
+
+        # CONCURRENTLY cannot run inside a transaction block, and lets
+        # writers keep inserting quotes while the indexes build
+        index_ddl = {
+            "idx_quotes_search_vector": search_index_ddl(
+                index_type, partial_pred, fastupdate
+            ),
+            **TSV_INDEX_DDL,
+        }
+        conn.execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            for name, ddl in index_ddl.items():
+                build_index_concurrently(conn, name, ddl)
+
+            # Fresh statistics for the new columns and indexes, so the
+            # planner picks the GIN indexes for @@ queries
+            conn.execute(ANALYZE_QUOTES)
+            row_estimate = conn.execute(QUOTES_ROW_ESTIMATE).scalar()
+            logger.info(f"Analyzed quotes (~{row_estimate:.0f} rows)")
+        finally:
+            conn.execution_options(isolation_level=conn.default_isolation_level)
+
+        logger.info("Search indexes created successfully")
     except Exception as e:
+        conn.rollback()
         logger.error(f"Failed to create search indexes: {e}")
         raise
 
 
-def main() -> None:
-    """Main entry point."""
+def main(
+    index_type: str = "gin",
+    partial_pred: Optional[str] = None,
+    fastupdate: bool = True,
+    force: bool = False
+) -> None:
+    """
+    Main entry point.
+
+    A database already at the Alembic head revision is left alone, so
+    repeat runs cost one query. One that Alembic manages but is behind
+    is upgraded; any other is set up below and stamped at head.
+
+    Args:
+        index_type: search_vector index access method ('gin' or 'gist')
+        partial_pred: Optional predicate for a partial search_vector index
+        fastupdate: Keep the GIN pending list
+        force: Run the full setup even if the schema is at head
+    """
     logger.info("Initializing database...")
 
     try:
-        # Test connection first
+        # Test connection first; opening it checks reachability and
+        # credentials, and it is reused for every step below
         try:
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            conn = engine.connect()
         except Exception as e:
             logger.error("=" * 60)
             logger.error("Database connection failed!")
@@ -90,46 +375,70 @@ def main() -> None:
             logger.error("See POSTGRESQL_SETUP.md for detailed instructions")
             raise
 
-        # Create tables
-        init_db()
+        with conn:
+            alembic_config = _alembic_config(conn)
+            current = MigrationContext.configure(conn).get_current_revision()
+            head = ScriptDirectory.from_config(alembic_config).get_current_head()
+            conn.commit()
 
-        # Add bilingual_group_id column if it doesn't exist (migration helper)
-        try:
-            from sqlalchemy import inspect
-            inspector = inspect(engine)
-            columns = [col['name'] for col in inspector.get_columns('quotes')]
-            
-            if 'bilingual_group_id' not in columns:
-                logger.info("Adding bilingual_group_id column to quotes table...")
-                with engine.connect() as conn:
-                    conn.execute(text(
-                        "ALTER TABLE quotes ADD COLUMN bilingual_group_id INTEGER"
-                    ))
-                    conn.execute(text(
-                        "CREATE INDEX IF NOT EXISTS idx_quotes_bilingual_group "
-                        "ON quotes(bilingual_group_id)"
-                    ))
-                    conn.execute(text(
-                        "CREATE INDEX IF NOT EXISTS idx_quotes_group_language "
-                        "ON quotes(bilingual_group_id, language)"
-                    ))
-                    conn.commit()
-                logger.info("✅ Added bilingual_group_id column and indexes")
-        except Exception as e:
-            logger.warning(
-                f"Could not add bilingual_group_id column: {e}. "
-                "This is OK if using Alembic migrations or column already exists."
-            )
+            if current == head and not force:
+                logger.info(f"Schema is at Alembic head ({head}), nothing to do")
+                return
+            if current is not None and not force:
+                logger.info(f"Upgrading schema from {current} to {head}...")
+                command.upgrade(alembic_config, "head")
+                conn.commit()
+                logger.info("Database initialization complete")
+                return
 
-        # Create search indexes (PostgreSQL specific)
-        # This will fail gracefully on SQLite (used in tests)
-        try:
-            create_search_indexes()
-        except Exception as e:
-            logger.warning(
-                f"Could not create PostgreSQL-specific indexes: {e}. "
-                "This is OK if using SQLite for testing."
-            )
+            # Create tables
+            init_db(conn)
+            conn.commit()
+
+            # Add bilingual_group_id column if it doesn't exist (migration helper)
+            try:
+                if not _has_column(conn, 'quotes', 'bilingual_group_id'):
+                    logger.info("Adding bilingual_group_id column to quotes table...")
+                    conn.execute(ADD_BILINGUAL_COLUMN)
+                    if IS_SQLITE:
+                        for name, target in BILINGUAL_INDEXES.items():
+                            conn.exec_driver_sql(
+                                f"CREATE INDEX IF NOT EXISTS {name} ON {target}"
+                            )
+                        conn.commit()
+                    else:
+                        conn.commit()
+                        # Both table scans run side by side without
+                        # blocking writers
+                        build_indexes_concurrently({
+                            name: "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                                  f"{name} ON {target}"
+                            for name, target in BILINGUAL_INDEXES.items()
+                        })
+                    logger.info("✅ Added bilingual_group_id column and indexes")
+            except Exception as e:
+                conn.rollback()
+                logger.warning(
+                    f"Could not add bilingual_group_id column: {e}. "
+                    "This is OK if using Alembic migrations or column already exists."
+                )
+
+            # Replace the language index with (language, id) (migration helper)
+            try:
+                conn.execute(CREATE_LANGUAGE_ID_INDEX)
+                conn.execute(DROP_LANGUAGE_INDEX)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.warning(f"Could not create (language, id) index: {e}")
+
+            # Create search indexes (PostgreSQL specific, skipped on SQLite)
+            create_search_indexes(index_type, partial_pred, fastupdate, conn)
+
+            # The steps above bring the schema to what every revision
+            # produces; record that so the next run is a no-op
+            command.stamp(alembic_config, "head")
+            conn.commit()
 
         logger.info("Database initialization complete")
     except Exception as e:
@@ -138,5 +447,39 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Initialize database tables and indexes"
+    )
+    parser.add_argument(
+        "--index-type",
+        choices=SEARCH_INDEX_TYPES,
+        default="gin",
+        help="Full-text index type: gin (read-heavy) or gist (write-heavy)"
+    )
+    parser.add_argument(
+        "--partial-pred",
+        default=None,
+        help="Only index rows matching this SQL predicate, "
+             "e.g. \"language IN ('en', 'ru')\""
+    )
+    parser.add_argument(
+        "--no-fastupdate",
+        action="store_true",
+        help="Build the GIN index with fastupdate=off (bursty writes)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run the full setup even if the schema is up to date"
+    )
+
+    args = parser.parse_args()
+    main(
+        index_type=args.index_type,
+        partial_pred=args.partial_pred,
+        fastupdate=not args.no_fastupdate,
+        force=args.force
+    )
 
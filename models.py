@@ -9,7 +9,7 @@ from typing import Optional
 
 from sqlalchemy import (
     Column, Integer, String, Text, ForeignKey, TIMESTAMP, Index,
-    UniqueConstraint, TypeDecorator
+    UniqueConstraint, TypeDecorator, FetchedValue
 )
 from sqlalchemy.orm import relationship
 
@@ -91,7 +91,16 @@ class Quote(Base):
     author_id = Column(Integer, ForeignKey("authors.id"), nullable=True)
     source_id = Column(Integer, ForeignKey("sources.id"), nullable=True)
     language = Column(String(10), nullable=False)
-    search_vector = Column(SearchVectorType(), nullable=True)  # Full-text search
+    # Full-text search; generated from text on PostgreSQL (init_database.py).
+    # FetchedValue keeps it out of INSERT/UPDATE: PostgreSQL only accepts
+    # DEFAULT for a generated column. Not Computed(): SQLite has no
+    # to_tsvector, so create_all keeps a plain nullable column there.
+    search_vector = Column(
+        SearchVectorType(),
+        nullable=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue()
+    )
     bilingual_group_id = Column(Integer, nullable=True, index=True)  # Groups EN/RU pairs
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
 
@@ -111,7 +120,8 @@ class Quote(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_quotes_language", "language"),
+        # (language, id) also serves ordered per-language scans (exports)
+        Index("idx_quotes_language_id", "language", "id"),
         Index("idx_quotes_author", "author_id"),
         Index("idx_quotes_bilingual_group", "bilingual_group_id"),
         Index("idx_quotes_group_language", "bilingual_group_id", "language"),
@@ -4,15 +4,25 @@ Quote repository for database operations.
 Handles CRUD operations and search queries for quotes.
 """
 
+import random
 import re
-from typing import List, Optional, Set
-from sqlalchemy import func, or_, and_
-from sqlalchemy.orm import Session, aliased
+from typing import List, Optional, Set, Tuple
+from sqlalchemy import func, select, text, table, column
+from sqlalchemy.orm import Session, aliased, selectinload
 
 from models import Quote, Author, Source, QuoteTranslation
 from repositories.search_strategy import get_search_strategy
+from utils.cache import invalidate
 from logger_config import logger
 
+# Materialized view of EN/RU pairs (PostgreSQL, add_bilingual_pairs_view)
+BILINGUAL_PAIRS_VIEW = table(
+    "bilingual_pairs",
+    column("group_id"),
+    column("en_id"),
+    column("ru_id")
+)
+
 
 class QuoteRepository:
     """Repository for quote operations."""
@@ -51,21 +61,23 @@ class QuoteRepository:
             
             # Check for duplicate quotes based on text similarity only
             # (not author - quotes can have same text but different authors)
-            # Get all quotes, then compare text similarity
+            # Stream (id, text) rows of all quotes and compare text similarity
             # Also check for similarity (more than half of the same words)
-            candidates = self.db.query(Quote).all()
+            candidates = self.db.execute(
+                select(Quote.id, Quote.text).execution_options(yield_per=5000)
+            )
             
             # Pre-tokenize incoming quote
             incoming_tokens = self._tokenize_text(normalized_text)
             incoming_token_count = len(incoming_tokens)
             
-            similar_candidate = None
-            for candidate in candidates:
-                candidate_text = candidate.text.strip().lower()
+            similar_id = None
+            for candidate_id, candidate_text in candidates:
+                candidate_text = candidate_text.strip().lower()
                 
                 # Exact match
                 if candidate_text == normalized_text:
-                    similar_candidate = candidate
+                    similar_id = candidate_id
                     break
                 
                 # Similarity check: more than half the same words
@@ -76,8 +88,15 @@ class QuoteRepository:
                 overlap = len(incoming_tokens & candidate_tokens)
                 
                 if overlap > incoming_token_count / 2:
-                    similar_candidate = candidate
+                    similar_id = candidate_id
                     break
+            candidates.close()
+            
+            # Only the matching quote is loaded as an ORM object
+            similar_candidate = (
+                self.db.get(Quote, similar_id) if similar_id is not None
+                else None
+            )
             
             if similar_candidate:
                 logger.debug(
@@ -134,6 +153,41 @@ class QuoteRepository:
             logger.error(f"Failed to get quote {quote_id}: {e}")
             raise
 
+    def get_random(self, bilingual_only: bool = False) -> Optional[Quote]:
+        """
+        Get a random quote, sampled on the database side.
+
+        Counts the matching rows, then fetches the id at a random offset
+        (no per-row random() and sort), so only a single quote is ever
+        materialized.
+
+        Args:
+            bilingual_only: Only consider quotes with a bilingual_group_id
+
+        Returns:
+            Random quote or None if no quote matches
+        """
+        try:
+            id_query = self.db.query(Quote.id)
+            if bilingual_only:
+                id_query = id_query.filter(
+                    Quote.bilingual_group_id.isnot(None)
+                )
+            total = id_query.with_entities(func.count(Quote.id)).scalar()
+            if not total:
+                return None
+            quote_id = id_query.offset(random.randrange(total)).limit(1).scalar()
+            if quote_id is None:
+                return None
+            return self.db.get(
+                Quote,
+                quote_id,
+                options=[selectinload(Quote.author), selectinload(Quote.source)]
+            )
+        except Exception as e:
+            logger.error(f"Failed to get random quote: {e}")
+            raise
+
     def search(
         self,
         query: str,
@@ -226,94 +280,150 @@ class QuoteRepository:
             logger.error(f"Failed to get quotes by group ID: {e}")
             return []
 
+    def _bilingual_pair_ids(self):
+        """
+        Get a selectable of (group_id, en_id, ru_id) rows.
+
+        PostgreSQL reads the bilingual_pairs materialized view; other
+        databases compute the same rows with a self-join on
+        bilingual_group_id.
+
+        Returns:
+            Selectable with group_id, en_id and ru_id columns
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            return BILINGUAL_PAIRS_VIEW
+
+        en_quote = aliased(Quote)
+        ru_quote = aliased(Quote)
+        return (
+            select(
+                en_quote.bilingual_group_id.label("group_id"),
+                func.min(en_quote.id).label("en_id"),
+                func.min(ru_quote.id).label("ru_id")
+            )
+            .join(
+                ru_quote,
+                ru_quote.bilingual_group_id == en_quote.bilingual_group_id
+            )
+            .where(en_quote.language == "en", ru_quote.language == "ru")
+            .group_by(en_quote.bilingual_group_id)
+            .subquery("bilingual_pairs")
+        )
+
     def get_bilingual_pairs(
         self,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[int] = None
     ) -> List[tuple[Quote, Quote]]:
         """
         Get quotes that have both English and Russian versions.
 
+        Pairs are ordered by bilingual_group_id; one query fetches the
+        page of pair ids and one more loads the quotes. Prefer keyset
+        pagination via ``after`` over ``offset`` for deep pages.
+
         Args:
             limit: Maximum number of pairs
             offset: Result offset for pagination
+            after: Only return pairs with bilingual_group_id above this
 
         Returns:
             List of (english_quote, russian_quote) tuples
         """
-        try:
-            from sqlalchemy.orm import aliased
+        pairs, _ = self.get_bilingual_pairs_page(limit, offset, after)
+        return pairs
 
-            # Use aliases for the two Quote instances
-            Quote1 = aliased(Quote)
-            Quote2 = aliased(Quote)
+    def get_bilingual_pairs_page(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[int] = None
+    ) -> Tuple[List[tuple[Quote, Quote]], Optional[int]]:
+        """
+        Get a page of bilingual pairs with the keyset cursor for the next.
 
-            # Find quotes with translations between en and ru
-            pairs = (
-                self.db.query(Quote1, Quote2)
-                .join(
-                    QuoteTranslation,
-                    Quote1.id == QuoteTranslation.quote_id
-                )
-                .join(
-                    Quote2,
-                    Quote2.id == QuoteTranslation.translated_quote_id
-                )
-                .filter(
-                    or_(
-                        and_(
-                            Quote1.language == "en",
-                            Quote2.language == "ru"
-                        ),
-                        and_(
-                            Quote1.language == "ru",
-                            Quote2.language == "en"
-                        )
-                    )
-                )
+        The cursor comes from the pair rows themselves, so pairs dropped
+        because their quotes are gone (view not yet refreshed) do not end
+        pagination early.
+
+        Args:
+            limit: Maximum number of pairs
+            offset: Result offset for pagination
+            after: Only return pairs with bilingual_group_id above this
+
+        Returns:
+            Tuple of ((english_quote, russian_quote) list, group id to pass
+            as ``after`` for the next page, or None on the last page)
+        """
+        try:
+            pair_ids = self._bilingual_pair_ids()
+            page_query = (
+                select(pair_ids.c.group_id, pair_ids.c.en_id, pair_ids.c.ru_id)
+                .order_by(pair_ids.c.group_id)
                 .limit(limit)
                 .offset(offset)
-                .all()
             )
+            if after is not None:
+                page_query = page_query.where(pair_ids.c.group_id > after)
+            rows = self.db.execute(page_query).all()
+
+            quote_ids = [
+                quote_id for _, en_id, ru_id in rows
+                for quote_id in (en_id, ru_id)
+            ]
+            quotes = {
+                quote.id: quote for quote in (
+                    self.db.query(Quote)
+                    .options(
+                        selectinload(Quote.author), selectinload(Quote.source)
+                    )
+                    .filter(Quote.id.in_(quote_ids))
+                )
+            }
+
+            result = [
+                (quotes[en_id], quotes[ru_id])
+                for _, en_id, ru_id in rows
+                if en_id in quotes and ru_id in quotes
+            ]
 
-            # Normalize to (en, ru) order
-            result = []
-            for q1, q2 in pairs:
-                if q1.language == "en":
-                    result.append((q1, q2))
-                else:
-                    result.append((q2, q1))
+            # A full page of rows means there may be more groups after it
+            next_cursor = (
+                rows[-1].group_id if rows and len(rows) == limit else None
+            )
 
             logger.debug(f"Found {len(result)} bilingual pairs")
-            return result
+            return result, next_cursor
         except Exception as e:
             logger.error(f"Failed to get bilingual pairs: {e}")
             raise
 
-    def update_search_vector(self, quote_id: int) -> None:
+    def refresh_bilingual_pairs(self) -> None:
         """
-        Update search vector for a quote (for full-text search).
+        Refresh the bilingual_pairs materialized view (PostgreSQL only).
 
-        Args:
-            quote_id: Quote ID
+        Call after bilingual_group_id values change (ingest, linking).
+        The view is derived from quotes, so a failed refresh is logged as
+        a warning rather than raised: the caller's writes are already
+        committed and the next refresh catches up. Cached pair pages are
+        dropped after a successful refresh.
         """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+
         try:
-            quote = self.get_by_id(quote_id)
-            if quote:
-                # Update search vector using PostgreSQL function
-                from sqlalchemy import update
-                stmt = (
-                    update(Quote)
-                    .where(Quote.id == quote_id)
-                    .values(
-                        search_vector=func.to_tsvector('english', Quote.text)
-                    )
-                )
-                self.db.execute(stmt)
-                self.db.commit()
-                logger.debug(f"Updated search vector for quote {quote_id}")
+            self.db.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY bilingual_pairs")
+            )
+            self.db.commit()
+            logger.info("Refreshed bilingual_pairs view")
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Failed to update search vector: {e}")
-            raise
+            logger.warning(f"Failed to refresh bilingual_pairs view: {e}")
+            return
+
+        # Pages and cursors cached by /api/quotes/bilingual/pairs
+        invalidate("pairs")
 
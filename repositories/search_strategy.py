@@ -6,13 +6,19 @@ implementations.
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, or_, literal_column
 
 from models import Quote
 from utils.text_utils import detect_language, sanitize_search_query, escape_like_pattern
 from logger_config import logger
 
+# Generated, GIN-indexed tsvector columns (PostgreSQL only, created by the
+# add_language_tsvectors migration); not mapped on Quote so that SQLite
+# schemas created via create_all stay valid
+TEXT_TSV_EN = literal_column("quotes.text_tsv_en")
+TEXT_TSV_RU = literal_column("quotes.text_tsv_ru")
+
 
 class SearchStrategy:
     """Base class for search strategies."""
@@ -75,7 +81,10 @@ class PostgreSQLSearchStrategy(SearchStrategy):
         if translated_query and translated_query.lower() != original_query.lower():
             queries_to_search.append(translated_query)
         
-        search_query = self.db.query(Quote)
+        # Eager-load relationships used when building result dicts
+        search_query = self.db.query(Quote).options(
+            selectinload(Quote.author), selectinload(Quote.source)
+        )
 
         # Only filter by language if explicitly requested
         if language:
@@ -93,16 +102,17 @@ class PostgreSQLSearchStrategy(SearchStrategy):
                 # For multi-word queries, plainto_tsquery will match them as a phrase
                 # (words must appear in order). This is good for phrase searches like "a love is"
                 search_conditions.extend([
-                    # English text search config
-                    func.to_tsvector('english', Quote.text).match(
+                    # English text search config (indexed generated column)
+                    TEXT_TSV_EN.bool_op('@@')(
                         func.plainto_tsquery('english', q)
                     ),
-                    # Russian text search config
-                    func.to_tsvector('russian', Quote.text).match(
+                    # Russian text search config (indexed generated column)
+                    TEXT_TSV_RU.bool_op('@@')(
                         func.plainto_tsquery('russian', q)
                     ),
                     # Simple (language-agnostic) config for broader matching
-                    func.to_tsvector('simple', Quote.text).match(
+                    # (search_vector is maintained with the 'simple' config)
+                    Quote.search_vector.bool_op('@@')(
                         func.plainto_tsquery('simple', q)
                     )
                 ])
@@ -131,17 +141,17 @@ class PostgreSQLSearchStrategy(SearchStrategy):
             search_query = search_query.order_by(
                 # Prioritize matches in the query's detected language
                 func.ts_rank(
-                    func.to_tsvector('simple', Quote.text),
+                    Quote.search_vector,
                     func.plainto_tsquery('simple', primary_query)
                 ).desc().nullslast(),
                 # Then by English config relevance
                 func.ts_rank(
-                    func.to_tsvector('english', Quote.text),
+                    TEXT_TSV_EN,
                     func.plainto_tsquery('english', primary_query)
                 ).desc().nullslast(),
                 # Then by Russian config relevance
                 func.ts_rank(
-                    func.to_tsvector('russian', Quote.text),
+                    TEXT_TSV_RU,
                     func.plainto_tsquery('russian', primary_query)
                 ).desc().nullslast()
             )
@@ -188,7 +198,10 @@ class SQLiteSearchStrategy(SearchStrategy):
         if translated_query and translated_query.lower() != original_query.lower():
             queries_to_search.append(translated_query)
         
-        search_query = self.db.query(Quote)
+        # Eager-load relationships used when building result dicts
+        search_query = self.db.query(Quote).options(
+            selectinload(Quote.author), selectinload(Quote.source)
+        )
 
         # Only filter by language if explicitly requested
         if language:
@@ -2,9 +2,9 @@
 Repository for word translation operations.
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import insert, or_
 
 from models import WordTranslation
 from logger_config import logger
@@ -144,6 +144,83 @@ class TranslationWordRepository:
             logger.error(f"Failed to bulk create translations: {e}")
             raise
 
+    def bulk_upsert(
+        self,
+        translations: List[dict],
+        commit: bool = True
+    ) -> List[dict]:
+        """
+        Create or update a batch of translations in one transaction.
+        
+        Applies the create_or_update rules to the whole batch with a single
+        lookup of existing words and a single multi-row INSERT.
+        
+        Args:
+            translations: List of dicts with 'word_en', 'word_ru', 'frequency_en', 'frequency_ru'
+            commit: Commit the batch; otherwise only flush it and leave the
+                commit to the caller (a failure still rolls back)
+            
+        Returns:
+            The newly created entries (normalized), in input order
+        """
+        try:
+            # Merge repeated English words in input order
+            entries: Dict[str, dict] = {}
+            for trans in translations:
+                word_en = trans.get('word_en', '').lower().strip()
+                word_ru = trans.get('word_ru', '').lower().strip()
+                frequency_en = trans.get('frequency_en', 0)
+                frequency_ru = trans.get('frequency_ru', 0)
+                entry = entries.get(word_en)
+                if entry is None:
+                    entries[word_en] = {
+                        'word_en': word_en,
+                        'word_ru': word_ru,
+                        'frequency_en': frequency_en,
+                        'frequency_ru': frequency_ru
+                    }
+                    continue
+                entry['frequency_en'] = max(entry['frequency_en'], frequency_en)
+                entry['frequency_ru'] = max(entry['frequency_ru'], frequency_ru)
+                if word_ru:
+                    entry['word_ru'] = word_ru
+            
+            if not entries:
+                return []
+            
+            # First row per English word, as create_or_update's .first()
+            existing: Dict[str, WordTranslation] = {}
+            rows = self.db.query(WordTranslation).filter(
+                WordTranslation.word_en.in_(list(entries))
+            ).order_by(WordTranslation.id)
+            for row in rows:
+                existing.setdefault(row.word_en, row)
+            
+            created = []
+            for word_en, entry in entries.items():
+                row = existing.get(word_en)
+                if row is None:
+                    created.append(entry)
+                    continue
+                if entry['frequency_en'] > row.frequency_en:
+                    row.frequency_en = entry['frequency_en']
+                if entry['frequency_ru'] > row.frequency_ru:
+                    row.frequency_ru = entry['frequency_ru']
+                if entry['word_ru'] and entry['word_ru'] != row.word_ru:
+                    row.word_ru = entry['word_ru']
+            
+            if created:
+                self.db.execute(insert(WordTranslation), created)
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+            return created
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to bulk upsert translations: {e}")
+            raise
+
     def get_count(self) -> int:
         """Get total number of translations."""
         return self.db.query(WordTranslation).count()
@@ -92,7 +92,8 @@ def reset_progress_file() -> None:
     import json
     import os
     
-    progress_file = "data/word_loading_progress.json"
+    # One JSON snapshot per line (see load_10k_words_batch.save_progress)
+    progress_file = "data/word_loading_progress.jsonl"
     
     if os.path.exists(progress_file):
         progress = {
@@ -103,7 +104,7 @@ def reset_progress_file() -> None:
         }
         
         with open(progress_file, 'w', encoding='utf-8') as f:
-            json.dump(progress, f, indent=2)
+            f.write(json.dumps(progress, separators=(',', ':')) + '\n')
         
         logger.info(f"Reset progress file: {progress_file}")
     else:
@@ -13,7 +13,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database import engine, SessionLocal
+from database import SessionLocal, IS_SQLITE
 from sqlalchemy import text
 from logger_config import logger
 
@@ -46,9 +46,7 @@ def drop_author_columns():
             return
         
         # Check if columns exist
-        is_sqlite = 'sqlite' in str(engine.url).lower()
-        
-        if is_sqlite:
+        if IS_SQLITE:
             # SQLite: Check if columns exist
             try:
                 db.execute(text("SELECT name, language FROM authors LIMIT 1"))
@@ -12,7 +12,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database import engine, SessionLocal
+from database import SessionLocal, IS_SQLITE
 from sqlalchemy import text
 from logger_config import logger
 
@@ -122,14 +122,11 @@ def finalize_author_schema():
     db = SessionLocal()
     
     try:
-        # Check database type
-        is_sqlite = 'sqlite' in str(engine.url).lower()
-        
         # Step 1: Ensure all authors have both names
         ensure_all_authors_have_both_names(db)
         
         # Step 2: Drop columns
-        if is_sqlite:
+        if IS_SQLITE:
             drop_columns_sqlite(db)
         else:
             drop_columns_postgresql(db)
@@ -39,6 +39,9 @@ def main():
         links_created = linker.link_all_bilingual_authors()
         logger.info(f"✅ Created {links_created} additional links")
         
+        # Refresh the bilingual_pairs view once for both steps
+        linker.quote_repo.refresh_bilingual_pairs()
+        
         # Summary
         logger.info("\n" + "=" * 60)
         logger.info("Summary:")
@@ -10,7 +10,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database import engine, Base
+from database import engine, Base, IS_SQLITE
 from sqlalchemy import text
 from logger_config import logger
 
@@ -20,10 +20,8 @@ def migrate_author_names():
     Add name_en and name_ru columns to authors table if they don't exist.
     """
     try:
-        is_sqlite = 'sqlite' in str(engine.url).lower()
-        
         with engine.connect() as conn:
-            if is_sqlite:
+            if IS_SQLITE:
                 # SQLite: Check if columns exist, add if not
                 try:
                     # Try to select from the columns - if they don't exist, will raise error
@@ -31,6 +31,9 @@ def main():
         links_created = linker.link_all_bilingual_authors()
         logger.info(f"✅ Created {links_created} additional links")
         
+        # Refresh the bilingual_pairs view once for both steps
+        linker.quote_repo.refresh_bilingual_pairs()
+        
     except Exception as e:
         logger.error(f"Failed to populate groups: {e}")
         raise
@@ -46,7 +46,8 @@ class BilingualLinker:
         quote_en_id: int,
         quote_ru_id: int,
         confidence: int = 80,
-        strategy: str = "manual"
+        strategy: str = "manual",
+        refresh_pairs: bool = False
     ) -> Tuple[Optional[QuoteTranslation], int]:
         """
         Link two quotes bidirectionally and assign bilingual_group_id.
@@ -56,6 +57,8 @@ class BilingualLinker:
             quote_ru_id: Russian quote ID
             confidence: Confidence score (0-100)
             strategy: Linking strategy used ('manual', 'author_match', 'similarity', etc.)
+            refresh_pairs: Refresh the bilingual_pairs view afterwards
+                (batch entry points refresh once at the end instead)
             
         Returns:
             Tuple of (translation object, bilingual_group_id)
@@ -117,17 +120,22 @@ class BilingualLinker:
                 f"(group_id={group_id}, confidence={confidence}, strategy={strategy})"
             )
             
-            return translation_en_ru, group_id
-            
         except Exception as e:
             self.db.rollback()
             logger.error(f"Failed to link quotes: {e}")
             raise
+        
+        # The link is committed; a failed refresh is only logged
+        if refresh_pairs:
+            self.quote_repo.refresh_bilingual_pairs()
+        
+        return translation_en_ru, group_id
 
     def find_matches_by_author(
         self,
         author_id: int,
-        min_confidence: int = 50
+        min_confidence: int = 50,
+        refresh_pairs: bool = False
     ) -> int:
         """
         Find and link quotes from same author using multiple strategies.
@@ -135,6 +143,7 @@ class BilingualLinker:
         Args:
             author_id: Author ID
             min_confidence: Minimum confidence score
+            refresh_pairs: Refresh the bilingual_pairs view afterwards
             
         Returns:
             Number of links created
@@ -210,11 +219,15 @@ class BilingualLinker:
             logger.info(
                 f"Created {links_created} links for author {author_id}"
             )
-            return links_created
             
         except Exception as e:
             logger.error(f"Failed to find matches by author: {e}")
             raise
+        
+        if refresh_pairs and links_created:
+            self.quote_repo.refresh_bilingual_pairs()
+        
+        return links_created
 
     def _find_best_match_by_similarity(
         self,
@@ -5,13 +5,72 @@ Extracted from SearchService to improve maintainability.
 Builds bilingual quote pairs from search results.
 """
 
+from operator import attrgetter
 from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from models import Quote
 from repositories.translation_repository import TranslationRepository
 from logger_config import logger
 
+# Attribute getters built once at import time (used for every result row)
+_get_quote_fields = attrgetter(
+    "id", "text", "language", "created_at", "author", "source"
+)
+_get_author_fields = attrgetter("id", "name_en", "name_ru", "bio")
+_get_source_fields = attrgetter("id", "title", "language", "source_type")
+
+
+def quote_to_dict(quote: Quote) -> Dict:
+    """
+    Convert Quote object to dictionary matching QuoteSchema.
+
+    Args:
+        quote: Quote object
+
+    Returns:
+        Quote dictionary compatible with QuoteSchema
+    """
+    quote_id, text, language, created_at, author, source = (
+        _get_quote_fields(quote)
+    )
+    result = {
+        "id": quote_id,
+        "text": text,
+        "language": language,
+        "author": None,
+        "source": None,
+        "has_translation": None,
+        "translation_count": None,
+        "created_at": created_at.isoformat() if created_at else None
+    }
+
+    # Add author if exists (matching AuthorSchema)
+    # Use name_en for EN quotes, name_ru for RU quotes
+    if author:
+        author_id, name_en, name_ru, bio = _get_author_fields(author)
+        result["author"] = {
+            "id": author_id,
+            "name": name_en if language == 'en' else name_ru,
+            "name_en": name_en,
+            "name_ru": name_ru,
+            "bio": bio
+        }
+
+    # Add source if exists (matching SourceSchema)
+    if source:
+        source_id, title, source_language, source_type = (
+            _get_source_fields(source)
+        )
+        result["source"] = {
+            "id": source_id,
+            "title": title,
+            "language": source_language,
+            "source_type": source_type
+        }
+
+    return result
+
 
 class BilingualPairBuilder:
     """
@@ -114,6 +173,7 @@ class BilingualPairBuilder:
             # Get both quotes from the group
             quotes = (
                 self.db.query(Quote)
+                .options(selectinload(Quote.author), selectinload(Quote.source))
                 .filter(Quote.bilingual_group_id == group_id)
                 .all()
             )
@@ -207,41 +267,4 @@ class BilingualPairBuilder:
         Returns:
             Quote dictionary compatible with QuoteSchema
         """
-        result = {
-            "id": quote.id,
-            "text": quote.text,
-            "language": quote.language,
-            "author": None,
-            "source": None,
-            "has_translation": None,
-            "translation_count": None,
-            "created_at": quote.created_at.isoformat() if quote.created_at else None
-        }
-        
-        # Add author if exists (matching AuthorSchema)
-        # Use name_en for EN quotes, name_ru for RU quotes
-        if quote.author:
-            author_name = (
-                quote.author.name_en if quote.language == 'en' 
-                else quote.author.name_ru
-            ) if quote.author else None
-            
-            result["author"] = {
-                "id": quote.author.id,
-                "name": author_name,  # Language-specific name for display
-                "name_en": quote.author.name_en,
-                "name_ru": quote.author.name_ru,
-                "bio": quote.author.bio
-            }
-        
-        # Add source if exists (matching SourceSchema)
-        if quote.source:
-            result["source"] = {
-                "id": quote.source.id,
-                "title": quote.source.title,
-                "language": quote.source.language,
-                "source_type": quote.source.source_type
-            }
-        
-        return result
-
+        return quote_to_dict(quote)
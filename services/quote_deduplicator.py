@@ -9,9 +9,10 @@ import re
 from typing import List, Tuple, Optional, Dict, Set
 from difflib import SequenceMatcher
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Row, func, select
 
 from models import Quote, QuoteTranslation
+from repositories.quote_repository import QuoteRepository
 from logger_config import logger
 
 
@@ -94,9 +95,22 @@ class QuoteDeduplicator:
         Returns:
             Similarity ratio (0.0-1.0)
         """
-        tokens1 = self.tokenize_text(text1)
-        tokens2 = self.tokenize_text(text2)
+        return self.jaccard_similarity(
+            self.tokenize_text(text1), self.tokenize_text(text2)
+        )
+    
+    @staticmethod
+    def jaccard_similarity(tokens1: Set[str], tokens2: Set[str]) -> float:
+        """
+        Calculate Jaccard similarity of two pre-tokenized texts.
         
+        Args:
+            tokens1: Tokens of the first text
+            tokens2: Tokens of the second text
+            
+        Returns:
+            Similarity ratio (0.0-1.0)
+        """
         if not tokens1 and not tokens2:
             return 1.0
         if not tokens1 or not tokens2:
@@ -268,7 +282,8 @@ class QuoteDeduplicator:
             })
             self.db.commit()
             logger.debug(
-                f"Merged bilingual_group_id {removed_group_id} into {target_group_id}"
+                "Merged bilingual_group_id %s into %s",
+                removed_group_id, target_group_id
             )
     
     def update_translation_links(
@@ -389,7 +404,8 @@ class QuoteDeduplicator:
         
         if dry_run:
             logger.info(
-                f"Would merge {len(removed_quotes)} quotes into quote ID {kept_quote.id}"
+                "Would merge %d quotes into quote ID %s",
+                len(removed_quotes), kept_quote.id
             )
             return stats
         
@@ -413,7 +429,8 @@ class QuoteDeduplicator:
         
         self.db.commit()
         logger.debug(
-            f"Merged {len(removed_quotes)} quotes into quote ID {kept_quote.id}"
+            "Merged %d quotes into quote ID %s",
+            len(removed_quotes), kept_quote.id
         )
         
         return stats
@@ -422,10 +439,13 @@ class QuoteDeduplicator:
         self,
         language: str,
         limit: Optional[int] = None
-    ) -> List[Tuple[Quote, Quote, float, str]]:
+    ) -> List[Tuple[Row, Row, float, str]]:
         """
         Find similar quotes within the same language.
         
+        Only (id, text, bilingual_group_id) rows are loaded, not full
+        Quote objects; the rows support the same attribute access.
+        
         Uses optimized approach:
         1. Exact matches via hash lookup (O(n))
         2. Token-based candidate filtering to reduce comparisons
@@ -438,13 +458,15 @@ class QuoteDeduplicator:
         Returns:
             List of tuples (quote1, quote2, similarity_score, method)
         """
-        # Get all quotes of the specified language
-        query = self.db.query(Quote).filter(Quote.language == language)
+        # Get the columns needed for matching for the specified language
+        query = select(
+            Quote.id, Quote.text, Quote.bilingual_group_id
+        ).where(Quote.language == language)
         
         if limit:
             query = query.limit(limit)
         
-        quotes = query.all()
+        quotes = self.db.execute(query).all()
         total_quotes = len(quotes)
         similar_pairs = []
         
@@ -455,8 +477,13 @@ class QuoteDeduplicator:
         exact_matches = {}
         normalized_to_quotes = {}
         
+        # Normalize each text once; step 3 looks these up per candidate
+        normalized_by_id = {
+            quote.id: self.normalize_text(quote.text) for quote in quotes
+        }
+        
         for quote in quotes:
-            normalized = self.normalize_text(quote.text)
+            normalized = normalized_by_id[quote.id]
             if normalized not in normalized_to_quotes:
                 normalized_to_quotes[normalized] = []
             normalized_to_quotes[normalized].append(quote)
@@ -473,11 +500,14 @@ class QuoteDeduplicator:
         
         # Step 2: Build token index for fast candidate filtering
         # Group quotes by their first few tokens to reduce comparisons
-        token_index: Dict[str, List[Quote]] = {}
+        token_index: Dict[str, List[Row]] = {}
         quotes_with_tokens = []
         
+        tokens_by_id: Dict[int, Set[str]] = {}
+        
         for quote in quotes:
             tokens = self.tokenize_text(quote.text)
+            tokens_by_id[quote.id] = tokens
             if tokens:
                 # Use first token as index key (most quotes will have unique first words)
                 first_token = sorted(tokens)[0]  # Use sorted for consistency
@@ -509,7 +539,7 @@ class QuoteDeduplicator:
                 )
             
             # Skip if already processed as exact match
-            normalized1 = self.normalize_text(quote1.text)
+            normalized1 = normalized_by_id[quote1.id]
             if normalized1 in processed_normalized:
                 continue
             
@@ -521,7 +551,10 @@ class QuoteDeduplicator:
             
             # Remove self and already processed exact matches
             candidates.discard(quote1)
-            candidates = [q for q in candidates if self.normalize_text(q.text) not in processed_normalized]
+            candidates = [
+                q for q in candidates
+                if normalized_by_id[q.id] not in processed_normalized
+            ]
             
             # Quick length filter: skip if length difference is too large
             len1 = len(quote1.text)
@@ -547,7 +580,9 @@ class QuoteDeduplicator:
                 processed_pairs.add(pair_key)
                 
                 # Try token similarity first (faster)
-                token_score = self.calculate_token_similarity(quote1.text, quote2.text)
+                token_score = self.jaccard_similarity(
+                    tokens1, tokens_by_id[quote2.id]
+                )
                 
                 if token_score >= self.token_threshold:
                     token_similar_pairs.append((quote1, quote2, token_score, 'token'))
@@ -580,7 +615,8 @@ class QuoteDeduplicator:
     def deduplicate_by_language(
         self,
         language: str,
-        dry_run: bool = False
+        dry_run: bool = False,
+        similar_pairs: Optional[List[Tuple[Row, Row, float, str]]] = None
     ) -> Dict:
         """
         Deduplicate quotes for a specific language.
@@ -588,6 +624,8 @@ class QuoteDeduplicator:
         Args:
             language: Language code ('en' or 'ru')
             dry_run: If True, only report what would be done
+            similar_pairs: Pairs already found by find_similar_quotes()
+                (searched here if not given)
             
         Returns:
             Dictionary with deduplication statistics
@@ -605,7 +643,8 @@ class QuoteDeduplicator:
         }
         
         # Find similar quotes
-        similar_pairs = self.find_similar_quotes(language)
+        if similar_pairs is None:
+            similar_pairs = self.find_similar_quotes(language)
         stats['similar_pairs_found'] = len(similar_pairs)
         
         if not similar_pairs:
@@ -669,5 +708,9 @@ class QuoteDeduplicator:
                         stats['similarity_methods'][method] += 1
                     break
         
+        # Merged groups and removed quotes change the pairs view
+        if not dry_run and stats['quotes_removed']:
+            QuoteRepository(self.db).refresh_bilingual_pairs()
+        
         return stats
 
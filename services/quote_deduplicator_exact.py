@@ -0,0 +1,81 @@
+"""
+Exact duplicate detection for quotes.
+
+Finds quotes with the same normalized text, author and language using a
+single GROUP BY query.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from models import Quote
+
+
+def _normalize_text(text: Optional[str]) -> Optional[str]:
+    """Normalize quote text the way the Python deduplicators do."""
+    return text.strip().lower() if text is not None else None
+
+
+@dataclass(slots=True)
+class DuplicateGroup:
+    """Group of quotes with the same normalized text, author and language."""
+
+    normalized_text: str
+    author_id: Optional[int]
+    language: str
+    count: int
+    ids: List[int]
+
+
+def find_exact_duplicates(db: Session) -> List[DuplicateGroup]:
+    """
+    Find exact duplicate quotes (legacy method for backward compatibility).
+    
+    Grouping runs in the database on both PostgreSQL and SQLite; only
+    one row per duplicate group is returned to Python. SQLite's lower()
+    folds ASCII letters only, so on SQLite the text is normalized by a
+    Python function registered on the connection (keeps Cyrillic case
+    variants in one group).
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        List of duplicate groups
+    """
+    is_sqlite = db.get_bind().dialect.name == "sqlite"
+    
+    if is_sqlite:
+        db.connection().connection.driver_connection.create_function(
+            "py_norm", 1, _normalize_text, deterministic=True
+        )
+        normalized_text = func.py_norm(Quote.text)
+        # SQLite has no arrays: aggregate ids into a comma-separated string
+        ids_column = func.group_concat(Quote.id)
+    else:
+        normalized_text = func.lower(func.trim(Quote.text))
+        ids_column = func.array_agg(Quote.id)
+    
+    rows = db.execute(
+        select(
+            normalized_text.label('normalized_text'),
+            Quote.author_id,
+            Quote.language,
+            func.count(Quote.id).label('count'),
+            ids_column.label('ids')
+        )
+        .group_by(normalized_text, Quote.author_id, Quote.language)
+        .having(func.count(Quote.id) > 1)
+    ).all()
+    
+    return [
+        DuplicateGroup(
+            text, author_id, language, count,
+            [int(quote_id) for quote_id in ids.split(',')] if is_sqlite
+            else list(ids)
+        )
+        for text, author_id, language, count, ids in rows
+    ]
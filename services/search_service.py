@@ -10,7 +10,7 @@ from sqlalchemy import func
 
 from repositories.quote_repository import QuoteRepository
 from repositories.translation_repository import TranslationRepository
-from services.bilingual_pair_builder import BilingualPairBuilder
+from services.bilingual_pair_builder import BilingualPairBuilder, quote_to_dict
 from models import Quote
 from utils.translator import get_bilingual_search_queries
 from logger_config import logger
@@ -255,20 +255,22 @@ class SearchService:
     def get_bilingual_pairs(
         self,
         limit: int = 50,
-        offset: int = 0
-    ) -> List[dict]:
+        after: Optional[int] = None
+    ) -> dict:
         """
-        Get quotes with both English and Russian versions.
+        Get a page of quotes with both English and Russian versions.
 
         Args:
             limit: Maximum number of pairs
-            offset: Result offset for pagination
+            after: Keyset cursor (next_cursor of the previous page)
 
         Returns:
-            List of bilingual pair dictionaries
+            Page dictionary: {"items": [...], "next_cursor": int or None}
         """
         try:
-            pairs = self.quote_repo.get_bilingual_pairs(limit, offset)
+            pairs, next_cursor = self.quote_repo.get_bilingual_pairs_page(
+                limit, after=after
+            )
             results = []
 
             for en_quote, ru_quote in pairs:
@@ -279,7 +281,7 @@ class SearchService:
                     "translation_source": None
                 })
 
-            return results
+            return {"items": results, "next_cursor": next_cursor}
         except Exception as e:
             logger.error(f"Failed to get bilingual pairs: {e}")
             raise
@@ -294,41 +296,4 @@ class SearchService:
         Returns:
             Quote dictionary compatible with QuoteSchema
         """
-        result = {
-            "id": quote.id,
-            "text": quote.text,
-            "language": quote.language,
-            "author": None,
-            "source": None,
-            "has_translation": None,
-            "translation_count": None,
-            "created_at": quote.created_at.isoformat() if quote.created_at
-            else None
-        }
-        
-        # Add author if exists (matching AuthorSchema)
-        # Use name_en for EN quotes, name_ru for RU quotes
-        if quote.author:
-            author_name = (
-                quote.author.name_en if quote.language == 'en' 
-                else quote.author.name_ru
-            ) if quote.author else None
-            
-            result["author"] = {
-                "id": quote.author.id,
-                "name": author_name,  # Language-specific name for display
-                "name_en": quote.author.name_en,
-                "name_ru": quote.author.name_ru,
-                "bio": quote.author.bio
-            }
-        
-        # Add source if exists (matching SourceSchema)
-        if quote.source:
-            result["source"] = {
-                "id": quote.source.id,
-                "title": quote.source.title,
-                "language": quote.source.language,
-                "source_type": quote.source.source_type
-            }
-        
-        return result
+        return quote_to_dict(quote)
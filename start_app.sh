@@ -91,7 +91,7 @@ PID_FILE=".app_pids.txt"
 # Start backend server
 echo ""
 echo "Starting backend API server..."
-uvicorn api.main:app --host 0.0.0.0 --port 8000 > logs/backend.log 2>&1 &
+uvicorn api.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools > logs/backend.log 2>&1 &
 BACKEND_PID=$!
 echo $BACKEND_PID > $PID_FILE
 
@@ -0,0 +1,69 @@
+"""
+Unit tests for author API routes.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.main import app
+from database import Base, get_db
+from models import Author
+from utils.cache import clear_local_cache
+
+
+@pytest.fixture
+def client_session():
+    """
+    Create a test client whose requests share one in-memory database.
+
+    Yields:
+        Tuple of (test client, database session)
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    app.dependency_overrides[get_db] = lambda: session
+    clear_local_cache()
+    try:
+        yield TestClient(app), session
+    finally:
+        app.dependency_overrides.clear()
+        clear_local_cache()
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+def test_search_authors_is_cached_in_process(client_session):
+    """Test that autocomplete results are served and cached without Redis."""
+    client, session = client_session
+    author = Author(name_en="Anton Chekhov", name_ru="Антон Чехов")
+    session.add(author)
+    session.commit()
+
+    response = client.get("/api/authors", params={"name": "Anton"})
+    assert response.status_code == 200
+    assert response.json() == [{
+        "id": author.id,
+        "name": "Anton Chekhov",
+        "name_en": "Anton Chekhov",
+        "name_ru": "Антон Чехов",
+        "bio": None,
+    }]
+
+    session.delete(author)
+    session.commit()
+
+    # Same (lowercased name, limit) key: answered from the cache
+    cached = client.get("/api/authors", params={"name": "anton"})
+    assert cached.json() == response.json()
+
+    clear_local_cache()
+    assert client.get("/api/authors", params={"name": "anton"}).json() == []
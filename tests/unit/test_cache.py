@@ -0,0 +1,91 @@
+"""
+Unit tests for the response cache helpers.
+"""
+
+from fnmatch import fnmatch
+
+from starlette.requests import Request
+
+import utils.cache
+from utils.cache import cached, etag_response, invalidate, make_cache_key
+
+
+def _request(headers: dict) -> Request:
+    """Build a bare GET request with the given headers."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in headers.items()
+        ],
+    })
+
+
+def test_cache_key_ignores_argument_order_and_session():
+    """Test that equivalent requests share a cache key."""
+    key1 = make_cache_key("search", {"q": "love", "limit": 50, "db": object()})
+    key2 = make_cache_key("search", {"limit": 50, "q": "love"})
+
+    assert key1 == key2
+    assert key1.startswith("aphorium:search:")
+    assert key1 != make_cache_key("search", {"q": "love", "limit": 10})
+
+
+def test_cached_passes_through_without_client():
+    """Test that endpoints work unchanged when caching is disabled."""
+    calls = []
+
+    @cached("test", ttl=10)
+    def endpoint(q: str) -> list:
+        calls.append(q)
+        return [q]
+
+    assert endpoint(q="a") == ["a"]
+    assert endpoint(q="a") == ["a"]
+    assert calls == ["a", "a"]
+
+
+class _FakeRedis:
+    """Minimal stand-in for the Redis calls invalidate() makes."""
+
+    def __init__(self, keys: list):
+        self.keys = set(keys)
+
+    def scan_iter(self, match: str, count: int):
+        return [key for key in self.keys if fnmatch(key, match)]
+
+    def delete(self, *keys):
+        self.keys.difference_update(keys)
+
+
+def test_invalidate_deletes_only_prefix_keys(monkeypatch):
+    """Test that invalidating a prefix keeps other endpoints' entries."""
+    pairs_key = make_cache_key("pairs", {"limit": 50})
+    search_key = make_cache_key("search", {"q": "love"})
+    client = _FakeRedis([pairs_key, search_key])
+    monkeypatch.setattr(utils.cache, "_client", client)
+
+    invalidate("pairs")
+
+    assert client.keys == {search_key}
+
+
+def test_etag_response_returns_304_for_matching_etag():
+    """Test that a repeat request with If-None-Match gets an empty 304."""
+    payload = {"id": 1, "text": "Вода камень точит"}
+
+    first = etag_response(_request({}), payload)
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "public, max-age=86400"
+
+    repeat = etag_response(_request({"If-None-Match": etag}), payload)
+    assert repeat.status_code == 304
+    assert repeat.body == b""
+
+    changed = etag_response(
+        _request({"If-None-Match": etag}), {**payload, "id": 2}
+    )
+    assert changed.status_code == 200
@@ -0,0 +1,31 @@
+"""
+Unit tests for exact duplicate detection.
+"""
+
+from sqlalchemy.orm import Session
+
+from models import Quote
+from services.quote_deduplicator_exact import find_exact_duplicates
+from tests.conftest import db_session
+
+
+def test_find_exact_duplicates_folds_cyrillic_case(db_session: Session):
+    """Test that case variants of Cyrillic text form one group."""
+    db_session.add_all([
+        Quote(text="Привет мир", language="ru"),
+        Quote(text=" привет мир ", language="ru"),
+        Quote(text="Hello world", language="en"),
+        Quote(text="HELLO WORLD", language="en"),
+        Quote(text="Пока мир", language="ru"),
+    ])
+    db_session.commit()
+
+    groups = {
+        group.normalized_text: sorted(group.ids)
+        for group in find_exact_duplicates(db_session)
+    }
+
+    assert groups == {
+        "привет мир": [1, 2],
+        "hello world": [3, 4],
+    }
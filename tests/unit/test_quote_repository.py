@@ -0,0 +1,109 @@
+"""
+Unit tests for quote repository.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from models import Quote
+from repositories.quote_repository import QuoteRepository
+from tests.conftest import db_session
+
+
+def test_get_random_returns_none_for_empty_table(db_session: Session):
+    """Test that random sampling handles an empty table."""
+    quote_repo = QuoteRepository(db_session)
+
+    assert quote_repo.get_random() is None
+    assert quote_repo.get_random(bilingual_only=True) is None
+
+
+def test_get_random_respects_bilingual_filter(db_session: Session):
+    """Test that bilingual sampling only returns grouped quotes."""
+    db_session.add_all([
+        Quote(text="Standalone quote.", language="en"),
+        Quote(text="Grouped quote.", language="en", bilingual_group_id=7),
+    ])
+    db_session.commit()
+
+    quote_repo = QuoteRepository(db_session)
+    for _ in range(10):
+        quote = quote_repo.get_random(bilingual_only=True)
+        assert quote is not None
+        assert quote.bilingual_group_id == 7
+
+    assert quote_repo.get_random() is not None
+
+
+def test_get_bilingual_pairs_uses_groups(db_session: Session):
+    """Test that pairs are built from bilingual groups in group order."""
+    db_session.add_all([
+        Quote(text="Second EN.", language="en", bilingual_group_id=2),
+        Quote(text="Second RU.", language="ru", bilingual_group_id=2),
+        Quote(text="First EN.", language="en", bilingual_group_id=1),
+        Quote(text="First RU.", language="ru", bilingual_group_id=1),
+        Quote(text="Lonely EN.", language="en", bilingual_group_id=3),
+    ])
+    db_session.commit()
+
+    quote_repo = QuoteRepository(db_session)
+    pairs = quote_repo.get_bilingual_pairs(limit=10)
+
+    assert [(en.text, ru.text) for en, ru in pairs] == [
+        ("First EN.", "First RU."),
+        ("Second EN.", "Second RU."),
+    ]
+    assert len(quote_repo.get_bilingual_pairs(limit=10, offset=1)) == 1
+
+    after_first = quote_repo.get_bilingual_pairs(limit=10, after=1)
+    assert [en.text for en, _ in after_first] == ["Second EN."]
+    assert quote_repo.get_bilingual_pairs(limit=10, after=2) == []
+
+
+def test_get_bilingual_pairs_page_cursor(db_session: Session):
+    """Test that the page cursor follows pair rows until the last page."""
+    db_session.add_all([
+        Quote(text="First EN.", language="en", bilingual_group_id=1),
+        Quote(text="First RU.", language="ru", bilingual_group_id=1),
+        Quote(text="Second EN.", language="en", bilingual_group_id=2),
+        Quote(text="Second RU.", language="ru", bilingual_group_id=2),
+    ])
+    db_session.commit()
+
+    quote_repo = QuoteRepository(db_session)
+    pairs, next_cursor = quote_repo.get_bilingual_pairs_page(limit=1)
+    assert [en.text for en, _ in pairs] == ["First EN."]
+    assert next_cursor == 1
+
+    pairs, next_cursor = quote_repo.get_bilingual_pairs_page(
+        limit=2, after=next_cursor
+    )
+    assert [en.text for en, _ in pairs] == ["Second EN."]
+    assert next_cursor is None
+
+
+def test_insert_leaves_out_generated_search_vector(db_session: Session):
+    """Test that quote INSERT/UPDATE never set the generated search_vector."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        quote = QuoteRepository(db_session).create(
+            text="Search vector test.", language="en"
+        )
+        quote.text = "Search vector test, edited."
+        db_session.commit()
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    # Written columns only; RETURNING may read the generated value back
+    writes = [
+        s.split(" RETURNING")[0] for s in statements
+        if s.startswith(("INSERT INTO quotes", "UPDATE quotes"))
+    ]
+    assert len(writes) == 2
+    assert all("search_vector" not in s for s in writes)
@@ -0,0 +1,34 @@
+"""
+Unit tests for translation word repository.
+"""
+
+from sqlalchemy.orm import Session
+
+from models import WordTranslation
+from repositories.translation_word_repository import TranslationWordRepository
+from tests.conftest import db_session
+
+
+def test_bulk_upsert_matches_create_or_update(db_session: Session):
+    """Test that bulk upsert inserts new words and updates existing ones."""
+    repo = TranslationWordRepository(db_session)
+    repo.create_or_update("house", "дом", frequency_en=5, frequency_ru=5)
+
+    created = repo.bulk_upsert([
+        {"word_en": "House", "word_ru": "здание", "frequency_en": 9},
+        {"word_en": "cat", "word_ru": "кот", "frequency_en": 3},
+        {"word_en": "cat", "word_ru": "кошка", "frequency_en": 1},
+    ])
+
+    assert [(w["word_en"], w["word_ru"]) for w in created] == [
+        ("cat", "кошка")
+    ]
+    rows = {
+        row.word_en: (row.word_ru, row.frequency_en, row.frequency_ru)
+        for row in db_session.query(WordTranslation)
+    }
+    assert rows == {
+        "house": ("здание", 9, 5),
+        "cat": ("кошка", 3, 0),
+    }
+    assert repo.bulk_upsert([]) == []
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from database import SessionLocal
 from models import Quote, QuoteTranslation
+from repositories.quote_repository import QuoteRepository
 from logger_config import setup_logging
 
 # Try to import translation service
@@ -343,6 +344,9 @@ def translate_ru_quotes_to_english(limit: Optional[int] = None, delay: float = 0
                 stats['link_failed'] += 1
                 logger.error(f"Failed to create translation link for quote ID {ru_quote.id}")
         
+        # Pairs endpoint reads a materialized view on PostgreSQL
+        QuoteRepository(db).refresh_bilingual_pairs()
+        
         # Summary
         logger.info("=" * 60)
         logger.info("Translation completed!")
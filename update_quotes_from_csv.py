@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from database import SessionLocal
 from models import Quote, QuoteTranslation
+from repositories.quote_repository import QuoteRepository
 from logger_config import setup_logging
 
 # Setup logging
@@ -295,6 +296,9 @@ def update_quotes_from_csv(csv_file: str = 'auto_output.csv'):
                 if not success and idx <= 10:  # Log first 10 failures for debugging
                     logger.debug(f"Row {idx}: {message}")
         
+        # Pairs endpoint reads a materialized view on PostgreSQL
+        QuoteRepository(db).refresh_bilingual_pairs()
+        
         # Summary
         logger.info("=" * 60)
         logger.info("Update completed!")
@@ -0,0 +1,271 @@
+"""
+Response caching for read-mostly API endpoints.
+
+Server-side caching is optional: it is enabled only when the ``redis``
+package is installed and ``REDIS_URL`` is configured. Any Redis failure
+is logged and the request falls through to the database. Endpoints that
+pass ``local_key`` fall back to a small per-process cache without Redis.
+HTTP validation caching (ETag / Cache-Control) needs no extra dependency.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from config import settings
+from logger_config import logger
+
+# Try to import redis (optional dependency)
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+    redis = None
+
+# Module-level client, set up by init_cache() in the app lifespan
+_client = None
+
+# Arguments that never take part in the cache key
+_SKIP_KEY_ARGS = {"db"}
+
+# Per-process fallback cache used when Redis is not configured:
+# (prefix, local key) -> (expiry time, result), least recently used first
+LOCAL_CACHE_SIZE = 1024
+_local_cache: OrderedDict = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def init_cache(redis_url: Optional[str], max_connections: int = 20) -> None:
+    """
+    Create the shared Redis client.
+
+    Args:
+        redis_url: Redis connection URL (caching disabled if empty)
+        max_connections: Connection pool size
+    """
+    global _client
+
+    if not redis_url:
+        logger.info("Response cache disabled (REDIS_URL not set)")
+        return
+    if not HAS_REDIS:
+        logger.warning(
+            "Response cache disabled: redis not available. "
+            "Install with: pip install redis"
+        )
+        return
+
+    pool = redis.ConnectionPool.from_url(
+        redis_url, max_connections=max_connections
+    )
+    _client = redis.Redis(connection_pool=pool)
+    logger.info("Response cache enabled")
+
+
+def close_cache() -> None:
+    """Close the shared Redis client, if any."""
+    global _client
+
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def make_cache_key(prefix: str, params: dict) -> str:
+    """
+    Build a cache key from normalized request parameters.
+
+    Args:
+        prefix: Endpoint-specific key prefix
+        params: Request parameters
+
+    Returns:
+        Cache key string
+    """
+    items = sorted(
+        (name, value) for name, value in params.items()
+        if name not in _SKIP_KEY_ARGS
+    )
+    digest = hashlib.sha1(
+        json.dumps(items, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"aphorium:{prefix}:{digest}"
+
+
+def invalidate(prefix: str) -> None:
+    """
+    Delete every cached response stored under a key prefix.
+
+    Batch scripts run without the app's shared client, so when none is
+    set up this connects from ``settings.redis_url`` for the call. Redis
+    failures are logged; entries then expire with their TTL.
+
+    Args:
+        prefix: Cache key prefix (as passed to ``cached``)
+    """
+    with _local_lock:
+        for key in [key for key in _local_cache if key[0] == prefix]:
+            del _local_cache[key]
+
+    client = _client
+    if client is None:
+        if not settings.redis_url or not HAS_REDIS:
+            return
+        client = redis.Redis.from_url(settings.redis_url)
+
+    try:
+        keys = list(client.scan_iter(match=f"aphorium:{prefix}:*", count=1000))
+        for start in range(0, len(keys), 1000):
+            client.delete(*keys[start:start + 1000])
+        logger.info(f"Invalidated {len(keys)} cached {prefix} responses")
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {prefix}: {e}")
+    finally:
+        if client is not _client:
+            client.close()
+
+
+def clear_local_cache() -> None:
+    """Drop every entry from the per-process fallback cache."""
+    with _local_lock:
+        _local_cache.clear()
+
+
+def _call_local_cached(
+    func: Callable,
+    key: tuple,
+    ttl: int,
+    args: tuple,
+    kwargs: dict
+) -> Any:
+    """
+    Call an endpoint through the per-process fallback cache.
+
+    Args:
+        func: Endpoint function
+        key: Cache key (prefix and endpoint-specific key)
+        ttl: Time to live in seconds
+        args: Positional arguments for the endpoint
+        kwargs: Keyword arguments for the endpoint
+
+    Returns:
+        Cached or freshly computed endpoint result
+    """
+    now = time.monotonic()
+    with _local_lock:
+        entry = _local_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _local_cache.move_to_end(key)
+            return entry[1]
+
+    result = func(*args, **kwargs)
+
+    with _local_lock:
+        _local_cache[key] = (now + ttl, result)
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > LOCAL_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+    return result
+
+
+def cached(
+    prefix: str,
+    ttl: int,
+    local_key: Optional[Callable[[dict], Hashable]] = None
+) -> Callable:
+    """
+    Decorator caching an endpoint's JSON response in Redis.
+
+    On a hit the stored JSON is returned as-is, skipping the database,
+    services, and response model validation. Endpoints must be called
+    with keyword arguments (as FastAPI does).
+
+    Without Redis, endpoints that give ``local_key`` are cached in
+    process instead. Their results are shared between requests, so they
+    must not hold session-bound ORM objects.
+
+    Args:
+        prefix: Cache key prefix
+        ttl: Time to live in seconds
+        local_key: Optional function building the per-process cache key
+            from the endpoint's keyword arguments
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if _client is None:
+                if local_key is not None:
+                    return _call_local_cached(
+                        func, (prefix, local_key(kwargs)), ttl, args, kwargs
+                    )
+                return func(*args, **kwargs)
+
+            key = make_cache_key(prefix, kwargs)
+            try:
+                payload = _client.get(key)
+            except Exception as e:
+                logger.warning(f"Cache read failed for {prefix}: {e}")
+                payload = None
+
+            if payload is not None:
+                return Response(content=payload, media_type="application/json")
+
+            result = func(*args, **kwargs)
+
+            if isinstance(result, Response):
+                # Endpoint already rendered its JSON body
+                payload = result.body
+            else:
+                payload = orjson.dumps(jsonable_encoder(result))
+
+            try:
+                _client.setex(key, ttl, payload)
+            except Exception as e:
+                logger.warning(f"Cache write failed for {prefix}: {e}")
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def etag_response(
+    request: Request,
+    content: Any,
+    max_age: int = 86400
+) -> Response:
+    """
+    Render JSON with a strong ETag, answering 304 when it still matches.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        content: JSON-serializable payload or Pydantic model
+        max_age: Cache-Control max-age in seconds
+
+    Returns:
+        200 response with the JSON body, or an empty 304 response
+    """
+    payload = orjson.dumps(jsonable_encoder(content))
+    etag = f'"{hashlib.md5(payload).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=payload, media_type="application/json", headers=headers
+    )